@@ -1,8 +1,36 @@
-"""Audio helpers for telliJASE."""
+"""Audio helpers for telliJASE.
+
+Submodules are imported on first attribute access (PEP 562), so importing
+one backend (e.g. ``tellijase.audio.stream``) does not also load the
+preview synth and its compiled kernels.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .engine import AY38914Synth
+    from .stream import SOUNDDEVICE_AVAILABLE, LivePSGStream
+    from .synthesizer import PSGSynthesizer
+
+_LAZY_EXPORTS = {
+    "AY38914Synth": ".engine",
+    "PSGSynthesizer": ".synthesizer",
+    "LivePSGStream": ".stream",
+    "SOUNDDEVICE_AVAILABLE": ".stream",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-from .engine import AY38914Synth
-from .synthesizer import PSGSynthesizer
-from .stream import LivePSGStream, SOUNDDEVICE_AVAILABLE
 
 __all__ = [
     "AY38914Synth",
@@ -0,0 +1,391 @@
+"""Inner-loop kernels for the audio backends.
+
+Loops are compiled with Numba when it is installed; otherwise the public
+helpers fall back to equivalent numpy code (or run the loop as plain
+Python), so Numba stays an optional speedup.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Tuple, Union
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None  # type: ignore
+
+
+# The 17-bit noise LFSR cycles through every non-zero state
+LFSR_PERIOD = (1 << 17) - 1
+
+# Byte alignment of scratch buffers from aligned_empty (one cache line,
+# enough for aligned AVX-512 loads)
+BUFFER_ALIGN = 64
+
+
+def _jit(func):
+    """Compile ``func`` with Numba when available, else return it unchanged."""
+    return njit(cache=True)(func) if NUMBA_AVAILABLE else func
+
+
+@_jit
+def _f32_to_i16_loop(src, dst):
+    for i in range(src.size):
+        v = src[i]
+        if v < -1.0:
+            v = -1.0
+        elif v > 1.0:
+            v = 1.0
+        dst[i] = np.int16(v * 32767.0)
+
+
+@_jit
+def _lfsr_loop(out, state):
+    for i in range(out.size):
+        bit = (state ^ (state >> 3)) & 1
+        state = (state >> 1) | (bit << 16)
+        out[i] = 1 if state & 1 else -1
+    return state
+
+
+def _lfsr_states_loop(states, state):
+    for i in range(states.size):
+        states[i] = state
+        bit = (state ^ (state >> 3)) & 1
+        state = (state >> 1) | (bit << 16)
+
+
+@_jit
+def _lfsr_hold_loop(out, state, hold):
+    n = out.size
+    i = 0
+    while i < n:
+        bit = (state ^ (state >> 3)) & 1
+        state = (state >> 1) | (bit << 16)
+        value = 1 if state & 1 else -1
+        end = min(i + hold, n)
+        for j in range(i, end):
+            out[j] = value
+        i = end
+    return state
+
+
+@_jit
+def _lfsr_clocked_loop(out, state, phase, inc):
+    for i in range(out.size):
+        phase += inc
+        while phase >= 0x100000000:
+            phase -= 0x100000000
+            bit = (state ^ (state >> 3)) & 1
+            state = (state >> 1) | (bit << 16)
+        out[i] = 1 if state & 1 else -1
+    return state, phase
+
+
+@_jit
+def _psg_mix_loop(
+    out, incs, volumes, tone_en, noise_en, phases, lfsr, noise_phase, noise_inc, use_noise, gain
+):
+    ph = phases.astype(np.int64)
+    noise_high = False
+    for i in range(out.size):
+        if use_noise and noise_inc > 0:
+            noise_phase += noise_inc
+            while noise_phase >= 0x100000000:
+                noise_phase -= 0x100000000
+                bit = (lfsr ^ (lfsr >> 3)) & 1
+                lfsr = (lfsr >> 1) | (bit << 16)
+            noise_high = (lfsr & 1) == 1
+        acc = 0
+        for c in range(incs.size):
+            high = ph[c] < 0x80000000 or not tone_en[c]
+            if noise_en[c] and not noise_high:
+                high = False
+            if high:
+                acc += volumes[c]
+            else:
+                acc -= volumes[c]
+            ph[c] = (ph[c] + incs[c]) & 0xFFFFFFFF
+        out[i] = acc * gain
+    return lfsr, noise_phase
+
+
+@_jit
+def _square_mix_loop(out, phase_incs, levels):
+    phases = np.zeros(phase_incs.size, dtype=np.int64)
+    for i in range(out.size):
+        acc = 0
+        for c in range(phase_incs.size):
+            if phases[c] < 0x80000000:
+                acc += levels[c]
+            else:
+                acc -= levels[c]
+            phases[c] = (phases[c] + phase_incs[c]) & 0xFFFFFFFF
+        out[i] = acc / 15.0
+
+
+def aligned_empty(
+    shape: Union[int, Tuple[int, ...]], dtype=np.float32, align: int = BUFFER_ALIGN
+) -> np.ndarray:
+    """Allocate an uninitialised array whose data starts on an ``align``-byte boundary.
+
+    numpy only guarantees element alignment, so this over-allocates a byte
+    buffer and returns the aligned view into it. Kernels may rely on the
+    first element of buffers allocated here being cache-line aligned.
+
+    Args:
+        shape: Array shape
+        dtype: Element type
+        align: Required alignment in bytes (a power of two)
+
+    Returns:
+        C-contiguous array of the requested shape and dtype
+    """
+    dtype = np.dtype(dtype)
+    shape = (shape,) if isinstance(shape, int) else tuple(shape)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    raw = np.empty(nbytes + align, dtype=np.uint8)
+    start = -raw.ctypes.data % align
+    end = start + nbytes
+    return raw[start:end].view(dtype).reshape(shape)
+
+
+def f32_to_i16(src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    """Clip float samples to [-1.0, 1.0] and scale into an int16 buffer.
+
+    Clip, scale and cast run as one fused pass when Numba is available.
+
+    Args:
+        src: Float samples
+        dst: Preallocated int16 output buffer, same length as src
+
+    Returns:
+        dst, filled in place
+    """
+    if NUMBA_AVAILABLE:
+        _f32_to_i16_loop(src, dst)
+    else:
+        np.multiply(np.clip(src, -1.0, 1.0), 32767.0, out=dst, casting="unsafe")
+    return dst
+
+
+def lfsr_fill(out: np.ndarray, state: int) -> int:
+    """Step the AY 17-bit noise LFSR once per element of ``out``.
+
+    Uses the same taps as the hardware (bits 0 and 3, fed back into bit 16)
+    and writes +1/-1 for the output bit after each step.
+
+    Args:
+        out: Preallocated output buffer (typically int8)
+        state: Current LFSR state (non-zero)
+
+    Returns:
+        LFSR state after the last step
+    """
+    if NUMBA_AVAILABLE:
+        return int(_lfsr_loop(out, state))
+    if out.size == 0:
+        return state
+
+    # Without Numba, read the whole batch out of the precomputed sequence
+    states, positions, outputs = _lfsr_sequence()
+    idx = np.arange(1, out.size + 1, dtype=np.int64)
+    idx += positions[state]
+    idx %= LFSR_PERIOD
+    out[:] = outputs[idx]
+    return int(states[idx[-1]])
+
+
+@functools.lru_cache(maxsize=None)
+def _lfsr_sequence() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Tabulate one full period of the LFSR, starting from state 1.
+
+    Returns:
+        Tuple of (state at each step, step index of each state, +1/-1
+        output bit at each step)
+    """
+    states = np.empty(LFSR_PERIOD, dtype=np.int32)
+    _lfsr_states_loop(states, 1)
+    positions = np.zeros(1 << 17, dtype=np.int64)
+    positions[states] = np.arange(LFSR_PERIOD)
+    outputs = np.where(states & 1, 1, -1).astype(np.int8)
+    return states, positions, outputs
+
+
+def lfsr_hold_fill(out: np.ndarray, state: int, hold: int) -> int:
+    """Fill ``out`` with +1/-1 noise, stepping the LFSR every ``hold`` samples.
+
+    The LFSR steps at the start of each hold, so the first sample already
+    reflects a fresh step (same taps as lfsr_fill).
+
+    Args:
+        out: Preallocated output buffer (float or int8)
+        state: Current LFSR state (non-zero)
+        hold: Samples per LFSR step (>= 1)
+
+    Returns:
+        LFSR state after the last step
+    """
+    if NUMBA_AVAILABLE:
+        return int(_lfsr_hold_loop(out, state, hold))
+    steps = np.empty(-(-out.size // hold), dtype=np.int8)
+    state = lfsr_fill(steps, state)
+    out[:] = np.repeat(steps, hold)[: out.size]
+    return state
+
+
+def lfsr_clocked_fill(out: np.ndarray, state: int, phase: int, inc: int) -> Tuple[int, int]:
+    """Fill ``out`` with +1/-1 noise from an LFSR clocked at the noise rate.
+
+    A 32-bit fixed-point accumulator (2**32 = one noise clock) advances by
+    ``inc`` per output sample; the LFSR steps each time it wraps, possibly
+    several times per sample. Carrying ``state`` and ``phase`` between calls
+    keeps the noise continuous across buffers.
+
+    Args:
+        out: Preallocated output buffer (float or int8)
+        state: Current LFSR state (non-zero)
+        phase: Current clock accumulator (0 to 2**32 - 1)
+        inc: Accumulator step per sample, ``noise_freq / sample_rate * 2**32``
+
+    Returns:
+        Tuple of (LFSR state, clock accumulator) after the last sample
+    """
+    if NUMBA_AVAILABLE:
+        state, phase = _lfsr_clocked_loop(out, state, phase, inc)
+        return int(state), int(phase)
+    if out.size == 0:
+        return state, phase
+
+    # Cumulative LFSR steps completed by each sample; outputs[0] is the
+    # current output bit, outputs[k] the bit after k further steps
+    ticks = phase + inc * np.arange(1, out.size + 1, dtype=np.int64)
+    steps = ticks >> 32
+    outputs = np.empty(int(steps[-1]) + 1, dtype=np.int8)
+    outputs[0] = 1 if state & 1 else -1
+    state = lfsr_fill(outputs[1:], state)
+    out[:] = outputs[steps]
+    return state, int(ticks[-1]) & 0xFFFFFFFF
+
+
+def psg_mix(
+    out: np.ndarray,
+    increments: np.ndarray,
+    volumes: np.ndarray,
+    tone_enabled: np.ndarray,
+    noise_enabled: np.ndarray,
+    phases: np.ndarray,
+    noise: Tuple[int, int, int],
+    use_noise: bool,
+    gain: float,
+) -> Tuple[int, int]:
+    """Render and mix PSG channels with AND-gated noise in one compiled pass.
+
+    Per sample: step the noise clock/LFSR (as lfsr_clocked_fill), gate each
+    channel's square wave with the noise bit where enabled, and sum
+    +/-volume. Only available with Numba; PSGSynthesizer falls back to
+    its numpy path otherwise.
+
+    Args:
+        out: Preallocated float32 output buffer
+        increments: Per-channel tone phase increment (0 holds the tone high)
+        volumes: Per-channel volume level
+        tone_enabled: Per-channel tone mixer enable
+        noise_enabled: Per-channel noise mixer enable
+        phases: Per-channel tone phase at the start of the buffer
+        noise: Tuple of (LFSR state, noise clock accumulator, clock increment);
+            an increment of 0 means the noise generator is off (noise low)
+        use_noise: Whether to run the noise generator at all
+        gain: Output scale applied to the integer level sum
+
+    Returns:
+        Tuple of (LFSR state, noise clock accumulator) after the buffer
+    """
+    lfsr, noise_phase, noise_inc = noise
+    lfsr, noise_phase = _psg_mix_loop(
+        out,
+        increments.astype(np.int64),
+        volumes.astype(np.int64),
+        tone_enabled,
+        noise_enabled,
+        phases,
+        lfsr,
+        noise_phase,
+        noise_inc,
+        use_noise,
+        np.float32(gain),
+    )
+    return int(lfsr), int(noise_phase)
+
+
+def square_mix(out: np.ndarray, phase_incs: np.ndarray, levels: np.ndarray) -> np.ndarray:
+    """Sum square-wave tone channels into a float buffer in a single pass.
+
+    Each channel runs a 32-bit fixed-point phase accumulator starting at 0;
+    it contributes +level for the first half of each cycle and -level for
+    the second. The integer sum is scaled by 1/15 (full volume = 1.0).
+
+    Args:
+        out: Preallocated float32 output buffer
+        phase_incs: Per-channel phase increment, ``freq / sample_rate * 2**32``
+        levels: Per-channel volume level (0-15)
+
+    Returns:
+        out, filled in place
+    """
+    if NUMBA_AVAILABLE:
+        _square_mix_loop(out, phase_incs.astype(np.int64), levels.astype(np.int64))
+        return out
+
+    # Broadcast all channels at once: phases has shape (channels, samples)
+    # and the uint32 product wraps exactly like the 32-bit accumulator
+    idx = np.arange(out.size, dtype=np.uint32)
+    phases = phase_incs.astype(np.uint32)[:, None] * idx
+    phases >>= 31
+    # +level while the top phase bit is clear, -level once it is set. Levels
+    # fit in int8, so the per-channel waves stay int8 and only the sum widens
+    signed = 1 - 2 * phases.astype(np.int8)
+    signed *= levels.astype(np.int8)[:, None]
+    acc = signed.sum(axis=0, dtype=np.int16)
+    np.divide(acc, 15.0, out=out)
+    return out
+
+
+def warm_up() -> None:
+    """Compile (or load from cache) the Numba kernels ahead of time.
+
+    Call before starting an audio thread so the first buffer is not
+    delayed by JIT compilation. Without Numba this builds the LFSR sequence
+    table used by the numpy fallback instead.
+    """
+    if not NUMBA_AVAILABLE:
+        _lfsr_sequence()
+        return
+    samples = np.zeros(1, dtype=np.float32)
+    _f32_to_i16_loop(samples, np.zeros(1, dtype=np.int16))
+    _lfsr_hold_loop(samples, 1, 1)
+    _lfsr_clocked_loop(samples, 1, 0, 1)
+    _square_mix_loop(samples, np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64))
+    flags = np.zeros(1, dtype=np.bool_)
+    zeros = np.zeros(1, dtype=np.int64)
+    psg_mix(samples, zeros, zeros, flags, flags, np.zeros(1, np.uint32), (1, 0, 1), True, 1.0)
+
+
+__all__ = [
+    "BUFFER_ALIGN",
+    "NUMBA_AVAILABLE",
+    "aligned_empty",
+    "f32_to_i16",
+    "lfsr_clocked_fill",
+    "lfsr_fill",
+    "lfsr_hold_fill",
+    "psg_mix",
+    "square_mix",
+    "warm_up",
+]
@@ -2,70 +2,127 @@
 
 from __future__ import annotations
 
+import functools
+from collections import OrderedDict
+from typing import Dict, Tuple, Union
+
 import numpy as np
 
+from tellijase.psg.registers import (
+    R0,
+    R1,
+    R2,
+    R3,
+    R4,
+    R5,
+    R6,
+    R8,
+    R9,
+    R10,
+    registers_to_array,
+)
 from tellijase.psg.utils import (
+    MAX_PERIOD,
     frequency_to_period,
     period_to_frequency,
     volume_to_amplitude,
 )
 
+from ._kernels import lfsr_hold_fill, square_mix
+
+# Number of rendered previews kept per synth instance
+RENDER_CACHE_SIZE = 32
+
+# Register indices for channels A/B/C: fine period, coarse period, volume
+_FINE_REGS = [R0, R2, R4]
+_COARSE_REGS = [R1, R3, R5]
+_VOLUME_REGS = [R8, R9, R10]
+
+# Fixed output gain: three full-scale tone channels (1.0 each) plus the
+# half-level noise can sum to at most 3.5, so this scale never clips and keeps
+# loudness consistent between snapshots instead of normalising each render.
+HEADROOM_SCALE = 1.0 / 3.5
+
+# Lookup tables over every 12-bit period and 4-bit volume value
+_FREQ_LUT = np.array([period_to_frequency(p) for p in range(MAX_PERIOD + 1)])
+_VOL_LUT = np.array([volume_to_amplitude(v) for v in range(16)], dtype=np.float32)
+
 
 class AY38914Synth:
     """Generates PCM audio for a static AY register snapshot."""
 
     def __init__(self, sample_rate: int = 44_100) -> None:
         self.sample_rate = sample_rate
+        # Rendered buffers keyed by (sample_rate, register bytes, duration)
+        self._render_cache: OrderedDict[Tuple, np.ndarray] = OrderedDict()
+
+    def render(
+        self, registers: Union[Dict[str, int], np.ndarray], duration: float = 1.5
+    ) -> np.ndarray:
+        """Render a mono PCM buffer from the provided registers.
+
+        Registers may be a 'R0'-'R15' dict or a uint8[16] register array.
+        Buffers are cached per register snapshot, so previewing an unchanged
+        state again skips synthesis. The returned array is read-only.
+        """
+        if not isinstance(registers, np.ndarray):
+            registers = registers_to_array(registers)
+        key = (self.sample_rate, registers.tobytes(), duration)
+        cached = self._render_cache.get(key)
+        if cached is not None:
+            self._render_cache.move_to_end(key)
+            return cached
+
+        pcm = self._render(registers, duration)
+        pcm.setflags(write=False)
+        self._render_cache[key] = pcm
+        if len(self._render_cache) > RENDER_CACHE_SIZE:
+            self._render_cache.popitem(last=False)
+        return pcm
+
+    def _render(self, regs: np.ndarray, duration: float) -> np.ndarray:
+        num_samples = max(1, int(self.sample_rate * duration))
+        regs = regs.astype(np.int64)
 
-    def render(self, registers: dict[str, int], duration: float = 1.5) -> np.ndarray:
-        """Render a mono PCM buffer from the provided registers."""
+        # tone channels A/B/C, looked up as arrays
+        fine = regs[_FINE_REGS]
+        coarse = regs[_COARSE_REGS] & 0x0F
+        periods = np.maximum(1, (coarse << 8) | fine)
+        levels = np.minimum(regs[_VOLUME_REGS], 15)
+        phase_incs = self._phase_increments(_FREQ_LUT[periods], self.sample_rate)
 
-        num_samples = max(1, int(self.sample_rate * duration))
-        t = np.arange(num_samples, dtype=np.float64) / self.sample_rate
-        mix = np.zeros(num_samples, dtype=np.float64)
-
-        # tone channels A/B/C
-        channels = [
-            ("R0", "R1", "R8"),
-            ("R2", "R3", "R9"),
-            ("R4", "R5", "R10"),
-        ]
-        for fine_reg, coarse_reg, vol_reg in channels:
-            period = self._read_period(registers, fine_reg, coarse_reg)
-            freq = period_to_frequency(period)
-            volume = volume_to_amplitude(registers.get(vol_reg, 0))
-            if freq <= 0 or volume <= 0:
-                continue
-            wave = self._square_wave(freq, t)
-            mix += wave * volume
+        # All audible tone channels are mixed in one pass over the output buffer
+        active = levels > 0
+        mix = np.empty(num_samples, dtype=np.float32)
+        square_mix(mix, phase_incs[active], levels[active].astype(np.int64))
 
         # crude noise approximation using shared period + volume from channel C
-        noise_period = registers.get("R6", 0)
-        noise_volume = volume_to_amplitude(registers.get("R10", 0))
+        noise_period = int(regs[R6])
+        noise_volume = _VOL_LUT[levels[2]]
         if noise_period > 0 and noise_volume > 0:
-            noise = self._noise_wave(noise_period, num_samples)
+            noise = self._noise_wave(noise_period, num_samples, self.sample_rate)
             mix += noise * noise_volume * 0.5
 
-        max_val = np.max(np.abs(mix)) or 1.0
-        mix = np.clip(mix / max_val, -1.0, 1.0)
-        return mix.astype(np.float32)
-
-    @staticmethod
-    def _square_wave(freq: float, t: np.ndarray) -> np.ndarray:
-        phase = (freq * t) % 1.0
-        return np.where(phase < 0.5, 1.0, -1.0)
+        mix *= np.float32(HEADROOM_SCALE)
+        return mix
 
     @staticmethod
-    def _noise_wave(period: int, length: int) -> np.ndarray:
-        rng = np.random.default_rng(seed=period)
-        return rng.uniform(-1.0, 1.0, size=length)
+    def _phase_increments(freqs: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Per-sample steps of 32-bit fixed-point phases (2**32 = one cycle)."""
+        return (freqs / sample_rate * (1 << 32)).astype(np.int64) & 0xFFFFFFFF
 
     @staticmethod
-    def _read_period(registers: dict[str, int], fine_reg: str, coarse_reg: str) -> int:
-        fine = registers.get(fine_reg, 0)
-        coarse = registers.get(coarse_reg, 0) & 0x0F
-        period = (coarse << 8) | fine
-        return max(1, period)
+    @functools.lru_cache(maxsize=64)
+    def _noise_wave(period: int, length: int, sample_rate: int) -> np.ndarray:
+        """Return int8 +/-1 noise from the 17-bit LFSR, clocked at the noise rate.
+
+        Cached per (period, length, sample_rate); the result is read-only.
+        """
+        hold = max(1, int(sample_rate / period_to_frequency(period)))
+        noise = np.empty(length, dtype=np.int8)
+        lfsr_hold_fill(noise, 1, hold)
+        noise.setflags(write=False)
+        return noise
 
 
 __all__ = ["AY38914Synth", "frequency_to_period", "period_to_frequency"]
@@ -5,11 +5,13 @@ from __future__ import annotations
 import logging
 import threading
 import time
+from typing import Optional
 
 import numpy as np
 
 try:
     import pygame.mixer
+    import pygame.sndarray
 
     PYGAME_AVAILABLE = True
     # Detect if using pygame-ce (community edition)
@@ -20,10 +22,18 @@ except ImportError:
     pygame = None  # type: ignore
 
 from ..models import PSGState
+from ._kernels import f32_to_i16
 from .synthesizer import PSGSynthesizer
 
 logger = logging.getLogger(__name__)
 
+# Number of Sound objects rotated through by the update loop. The channel
+# only ever holds one playing + one queued sound, so four leaves slack.
+SOUND_POOL_SIZE = 4
+
+# pygame.mixer's own buffer in samples; generated Sounds are never shorter
+MIXER_BUFFER = 1024
+
 
 class PygamePSGPlayer:
     """Real-time PSG audio using pygame.mixer.
@@ -37,24 +47,41 @@ class PygamePSGPlayer:
         psg_state: PSGState,
         sample_rate: int = 44100,
         buffer_size: int = 4096,  # Larger buffer for smoother playback
+        latency_ms: Optional[float] = None,
     ):
         """Initialize pygame audio player.
 
         Args:
-            psg_state: PSG state to read parameters from
+            psg_state: Initial PSG state to play
             sample_rate: Audio sample rate in Hz
             buffer_size: Audio buffer size in samples
+            latency_ms: Target buffer length in milliseconds; overrides
+                buffer_size if given (but never below MIXER_BUFFER samples)
         """
+        if latency_ms is not None:
+            buffer_size = _latency_buffer_size(sample_rate, latency_ms)
         self.psg_state = psg_state
         self.sample_rate = sample_rate
         self.buffer_size = buffer_size
-        self.synth = PSGSynthesizer(sample_rate)
+        self.synth = PSGSynthesizer(sample_rate, buffer_size)
         self.available = PYGAME_AVAILABLE
         self.playing = False
         self.channel = None
         self.update_thread = None
         self.stop_event = threading.Event()
 
+        # Register file rendered by the update thread, replaced by set_registers()
+        self._registers = psg_state.to_register_array()
+
+        # Update loop poll interval: half a Sound, so the queue is refilled
+        # well before the playing Sound runs out even if a poll is delayed
+        self._poll_interval = buffer_size / sample_rate / 2
+
+        # Reusable Sounds with zero-copy int16 views onto their sample data
+        self._sound_pool: list = []
+        self._sound_bufs: list[np.ndarray] = []
+        self._pool_index = 0
+
         if not self.available:
             logger.warning("pygame not available - audio disabled")
             return
@@ -65,13 +92,30 @@ class PygamePSGPlayer:
                 frequency=sample_rate,
                 size=-16,  # 16-bit signed
                 channels=1,  # Mono
-                buffer=1024,  # System buffer (not our generation buffer)
+                buffer=MIXER_BUFFER,  # System buffer (not our generation buffer)
             )
+            # The mixer may run at a different rate than requested (or have been
+            # initialised earlier with other settings), so render at the actual one
+            mixer_rate = pygame.mixer.get_init()[0]
+            if mixer_rate != sample_rate:
+                logger.info(f"pygame mixer negotiated {mixer_rate}Hz (requested {sample_rate}Hz)")
+                self.sample_rate = mixer_rate
+                if latency_ms is not None:
+                    # Keep the latency target at the rate actually played
+                    buffer_size = _latency_buffer_size(mixer_rate, latency_ms)
+                    self.buffer_size = buffer_size
+                self.synth = PSGSynthesizer(mixer_rate, buffer_size)
+                self._poll_interval = buffer_size / mixer_rate / 2
             # Reserve a channel for our audio
             pygame.mixer.set_num_channels(1)
             self.channel = pygame.mixer.Channel(0)
+            self._sound_pool = [
+                pygame.sndarray.make_sound(np.zeros(buffer_size, dtype=np.int16))
+                for _ in range(SOUND_POOL_SIZE)
+            ]
+            self._sound_bufs = [pygame.sndarray.samples(sound) for sound in self._sound_pool]
             logger.info(
-                f"PygamePSGPlayer initialized: {sample_rate}Hz, "
+                f"PygamePSGPlayer initialized: {self.sample_rate}Hz, "
                 f"{buffer_size} samples (pygame {PYGAME_VERSION})"
             )
         except Exception as e:
@@ -79,30 +123,69 @@ class PygamePSGPlayer:
             self.available = False
 
     def _audio_update_loop(self) -> None:
-        """Background thread that continuously regenerates and queues audio."""
+        """Background thread that continuously regenerates and queues audio.
+
+        All synthesis happens here, including the first buffer, so start()
+        returns without rendering on the caller's (GUI) thread.
+        """
         logger.debug("Audio update thread started")
 
         try:
+            # Generate and play initial buffer to start audio immediately
+            self.channel.play(self._render_pooled_sound(self._registers))
+
             while not self.stop_event.is_set():
                 # Check if channel has room in queue (queue() returns None if full)
                 if self.channel.get_queue() is None:
-                    # Generate fresh buffer with current PSG state
-                    state = self.psg_state.snapshot()
-                    samples = self.synth.render_buffer(self.buffer_size, state)
-                    pcm = self._to_int16(samples)
+                    # Render current PSG state into the next pooled sound and queue it
+                    self.channel.queue(self._render_pooled_sound(self._registers))
 
-                    # Create sound and queue it
-                    sound = pygame.mixer.Sound(buffer=pcm)
-                    self.channel.queue(sound)
-
-                # Small sleep to avoid busy-waiting
-                time.sleep(0.01)  # 10ms
+                # Sleep between polls to avoid busy-waiting
+                time.sleep(self._poll_interval)
 
         except Exception as e:
             logger.error(f"Error in audio update loop: {e}")
         finally:
             logger.debug("Audio update thread stopped")
 
+    def set_registers(self, regs: np.ndarray) -> None:
+        """Publish the register file to play from now on.
+
+        Call from the UI thread whenever the PSG state changes. The array is
+        copied and swapped in with one reference assignment, so the render
+        thread never sees a half-updated register file and needs no lock.
+
+        Args:
+            regs: uint8[16] register array (PSGState.to_register_array())
+        """
+        self._registers = np.array(regs, dtype=np.uint8)
+
+    def playback_time_ns(self) -> Optional[int]:
+        """Audio clock - not available with pygame.
+
+        pygame.mixer reports no sample position, and queued Sounds only
+        mark block boundaries, so callers should use their own clock.
+
+        Returns:
+            Always None
+        """
+        return None
+
+    def _render_pooled_sound(self, regs: np.ndarray):
+        """Render one buffer in place into the next Sound of the pool.
+
+        Args:
+            regs: uint8[16] register array of the PSG state to render
+
+        Returns:
+            The pygame Sound holding the freshly rendered samples
+        """
+        index = self._pool_index
+        samples = self.synth.render_buffer(self.buffer_size, regs)
+        f32_to_i16(samples, self._sound_bufs[index])
+        self._pool_index = (index + 1) % len(self._sound_pool)
+        return self._sound_pool[index]
+
     def start(self) -> bool:
         """Start continuous audio playback with real-time parameter updates.
 
@@ -120,14 +203,7 @@ class PygamePSGPlayer:
             return True
 
         try:
-            # Generate and play initial buffer to start audio immediately
-            state = self.psg_state.snapshot()
-            samples = self.synth.render_buffer(self.buffer_size, state)
-            pcm = self._to_int16(samples)
-            sound = pygame.mixer.Sound(buffer=pcm)
-            self.channel.play(sound)
-
-            # Start background thread to continuously regenerate audio
+            # Start background thread to render and continuously regenerate audio
             self.stop_event.clear()
             self.update_thread = threading.Thread(
                 target=self._audio_update_loop, daemon=True, name="PygameAudioUpdate"
@@ -170,18 +246,18 @@ class PygamePSGPlayer:
         """
         return self.playing
 
-    @staticmethod
-    def _to_int16(samples: np.ndarray) -> np.ndarray:
-        """Convert float32 samples to int16 for pygame.
 
-        Args:
-            samples: Float samples in range [-1.0, 1.0]
+def _latency_buffer_size(sample_rate: int, latency_ms: float) -> int:
+    """Samples per generated Sound for a latency target.
 
-        Returns:
-            Int16 samples
-        """
-        clipped = np.clip(samples, -1.0, 1.0)
-        return (clipped * 32767).astype(np.int16)
+    Args:
+        sample_rate: Mixer sample rate in Hz
+        latency_ms: Target buffer length in milliseconds
+
+    Returns:
+        Buffer size in samples, at least MIXER_BUFFER
+    """
+    return max(MIXER_BUFFER, int(sample_rate * latency_ms / 1000))
 
 
 __all__ = ["PygamePSGPlayer", "PYGAME_AVAILABLE", "PYGAME_VERSION"]
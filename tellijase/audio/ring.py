@@ -0,0 +1,125 @@
+"""Single-producer/single-consumer PCM ring buffer."""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+
+
+class PCMRingBuffer:
+    """Fixed-size PCM sample ring shared by a producer and a consumer.
+
+    One thread writes rendered samples, another (typically an audio
+    callback) reads them out. Each side only advances its own counter, and
+    sample data is copied before the counter moves, so no lock is taken on
+    the read path. Each side signals the other when it moves its counter.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float32):
+        """Allocate the ring.
+
+        Args:
+            capacity: Maximum number of buffered samples
+            dtype: Sample type (float32 or int16 PCM)
+        """
+        self.capacity = capacity
+        self._buf = np.zeros(capacity, dtype=dtype)
+        # Monotonic totals; positions in the ring are taken modulo capacity
+        self._written = 0
+        self._read = 0
+        self._space_freed = threading.Event()
+        self._data_ready = threading.Event()
+
+    @property
+    def available(self) -> int:
+        """Number of samples ready to be read."""
+        return self._written - self._read
+
+    @property
+    def space(self) -> int:
+        """Number of samples that can be written without overwriting."""
+        return self.capacity - self.available
+
+    def write(self, samples: np.ndarray) -> int:
+        """Copy as many samples as fit into the ring.
+
+        Args:
+            samples: Samples to append (converted to the ring's dtype)
+
+        Returns:
+            Number of samples written
+        """
+        count = min(len(samples), self.space)
+        start = self._written % self.capacity
+        end = min(start + count, self.capacity)
+        first = end - start
+        self._buf[start:end] = samples[:first]
+        self._buf[: count - first] = samples[first:count]
+        self._written += count
+        self._data_ready.set()
+        return count
+
+    def read_into(self, out: np.ndarray) -> int:
+        """Move buffered samples into ``out``, padding any shortfall with silence.
+
+        Args:
+            out: Output buffer to fill
+
+        Returns:
+            Number of buffered samples copied (less than len(out) on underrun)
+        """
+        count = min(len(out), self.available)
+        start = self._read % self.capacity
+        end = min(start + count, self.capacity)
+        first = end - start
+        out[:first] = self._buf[start:end]
+        out[first:count] = self._buf[: count - first]
+        out[count:] = 0
+        self._read += count
+        self._space_freed.set()
+        return count
+
+    def wait_for_space(self, amount: int, timeout: float) -> bool:
+        """Block the producer until ``amount`` samples can be written.
+
+        Args:
+            amount: Number of free samples needed
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the space is available
+        """
+        if self.space >= amount:
+            return True
+        self._space_freed.clear()
+        # Re-check after clearing so a read in between is not missed
+        if self.space >= amount:
+            return True
+        self._space_freed.wait(timeout)
+        return self.space >= amount
+
+    def wait_for_data(self, amount: int, timeout: float) -> bool:
+        """Block the consumer until ``amount`` samples are buffered.
+
+        Args:
+            amount: Number of buffered samples needed
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the samples are available
+        """
+        if self.available >= amount:
+            return True
+        self._data_ready.clear()
+        if self.available >= amount:
+            return True
+        self._data_ready.wait(timeout)
+        return self.available >= amount
+
+    def clear(self) -> None:
+        """Drop all buffered samples (only call while the consumer is idle)."""
+        self._read = self._written
+
+
+__all__ = ["PCMRingBuffer"]
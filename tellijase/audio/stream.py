@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+import threading
+from time import monotonic_ns
+from typing import Optional, Tuple
+
+import numpy as np
 
 try:
     import sounddevice as sd
@@ -14,17 +18,26 @@ except (ImportError, OSError):
     sd = None  # type: ignore
 
 from ..models import PSGState
+from ._kernels import f32_to_i16
+from .ring import PCMRingBuffer
 from .synthesizer import PSGSynthesizer
 
 logger = logging.getLogger(__name__)
 
+# Bounds for the callback block size picked from the device's native period
+MIN_BLOCK_SIZE = 128
+
+# Longest time start() waits for the first rendered block, in seconds
+PREFILL_TIMEOUT = 0.5
+
 
 class LivePSGStream:
     """Real-time PSG audio streaming with sounddevice.
 
-    This provides continuous audio output that responds immediately to
-    parameter changes in the PSGState. The audio callback runs in a
-    separate thread managed by sounddevice.
+    This provides continuous audio output of the register file last
+    published with set_registers(). A producer thread renders blocks into a
+    small ring buffer; the audio callback, run by sounddevice in its own
+    thread, only copies samples out of the ring.
     """
 
     def __init__(
@@ -32,21 +45,50 @@ class LivePSGStream:
         psg_state: PSGState,
         sample_rate: int = 44100,
         block_size: int = 2048,
+        latency_ms: Optional[float] = None,
     ):
         """Initialize the live audio stream.
 
         Args:
-            psg_state: PSG state to read parameters from
+            psg_state: Initial PSG state to play
             sample_rate: Audio sample rate in Hz
             block_size: Audio buffer size in samples (~46ms @ 44.1kHz)
+            latency_ms: Target block length in milliseconds; overrides
+                block_size if given
         """
+        if latency_ms is not None:
+            # start() may shrink this further to the device's native period
+            block_size = max(MIN_BLOCK_SIZE, int(sample_rate * latency_ms / 1000))
         self.psg_state = psg_state
         self.sample_rate = sample_rate
         self.block_size = block_size
-        self.synth = PSGSynthesizer(sample_rate)
+        self.synth = PSGSynthesizer(sample_rate, block_size)
         self.stream: Optional[sd.OutputStream] = None  # type: ignore
         self.available = SOUNDDEVICE_AVAILABLE
 
+        # Up to two blocks rendered ahead of the callback, as int16 PCM: the
+        # PSG mix has far less than 16 bits of dynamic range, so this halves
+        # the data handed to PortAudio at no audible cost
+        self._ring = PCMRingBuffer(block_size * 2, dtype=np.int16)
+        self._pcm = np.empty(block_size, dtype=np.int16)
+        self._producer: Optional[threading.Thread] = None
+        self._producer_stop = threading.Event()
+
+        # Register file rendered by the producer, replaced by set_registers()
+        self._registers = psg_state.to_register_array()
+
+        # Audio clock, set by the callback as one tuple so readers never see
+        # a torn update: (samples played before the current block, monotonic
+        # ns when its callback ran). None until the first callback.
+        self._samples_played = 0
+        self._clock: Optional[Tuple[int, int]] = None
+
+        # Callback status flags are counted in the audio thread and logged
+        # by the producer, keeping logging (and its lock) off the audio thread
+        self._status_count = 0
+        self._status_reported = 0
+        self._last_status: Optional[sd.CallbackFlags] = None  # type: ignore
+
         if not self.available:
             logger.warning(
                 "sounddevice not available - audio streaming disabled. "
@@ -62,34 +104,113 @@ class LivePSGStream:
         time: sd.CallbackFlags,
         status: sd.CallbackFlags,
     ) -> None:  # type: ignore
-        """Audio callback - called by sounddevice thread to generate samples.
+        """Audio callback - called by sounddevice thread to fetch samples.
 
-        This runs in a separate thread. It takes a snapshot of the current
-        PSG state and generates audio samples on demand.
+        This runs in a separate thread. Synthesis happens in the producer
+        thread, so the callback only copies pre-rendered samples from the
+        ring buffer (silence on underrun).
 
         Args:
-            outdata: Output buffer to fill
+            outdata: int16 output buffer to fill
             frames: Number of frames requested
             time: Timing information
             status: Status flags (errors, etc.)
         """
         if status:
-            logger.warning(f"Audio callback status: {status}")
+            self._last_status = status
+            self._status_count += 1
 
-        try:
-            # Thread-safe snapshot of current state
-            state = self.psg_state.snapshot()
+        self._clock = (self._samples_played, monotonic_ns())
+        self._samples_played += frames
 
-            # Generate samples with phase continuity
-            samples = self.synth.render_buffer(frames, state)
+        # sounddevice expects Nx1 shape for mono
+        self._ring.read_into(outdata[:, 0])
 
-            # Write to output (sounddevice expects Nx1 shape for mono)
-            outdata[:] = samples.reshape(-1, 1)
+    def _producer_loop(self) -> None:
+        """Render blocks into the ring buffer whenever there is room.
 
-        except Exception as e:
-            logger.error(f"Error in audio callback: {e}")
-            # Fill with silence on error
-            outdata.fill(0)
+        Runs in a background thread. Each block renders the latest published
+        register file, so parameter changes are heard within a block or two.
+        """
+        while not self._producer_stop.is_set():
+            if not self._ring.wait_for_space(self.block_size, timeout=0.1):
+                continue
+            try:
+                # Generate samples with phase continuity
+                samples = self.synth.render_buffer(self.block_size, self._registers)
+            except Exception as e:
+                logger.error(f"Error rendering audio: {e}")
+                self._producer_stop.wait(0.1)
+                continue
+            self._ring.write(f32_to_i16(samples, self._pcm))
+            self._report_callback_status()
+
+    def _report_callback_status(self) -> None:
+        """Log callback status flags (underruns etc.) seen since the last report."""
+        count = self._status_count
+        if count != self._status_reported:
+            logger.warning(
+                f"Audio callback status: {self._last_status} "
+                f"({count - self._status_reported} callbacks)"
+            )
+            self._status_reported = count
+
+    def set_registers(self, regs: np.ndarray) -> None:
+        """Publish the register file to play from now on.
+
+        Call from the UI thread whenever the PSG state changes. The array is
+        copied and swapped in with one reference assignment, so the render
+        thread never sees a half-updated register file and needs no lock.
+
+        Args:
+            regs: uint8[16] register array (PSGState.to_register_array())
+        """
+        self._registers = np.array(regs, dtype=np.uint8)
+
+    def playback_time_ns(self) -> Optional[int]:
+        """Audio clock: how much audio the device has played, in nanoseconds.
+
+        Advances a block at a time as the callback runs, and is interpolated
+        with the monotonic clock within the current block.
+
+        Returns:
+            Nanoseconds of audio played since the stream was opened, or None
+            if the stream is not playing or has not run a callback yet
+        """
+        clock = self._clock
+        if clock is None or not self.is_playing():
+            return None
+        samples, stamp_ns = clock
+        block_ns = self.block_size * 1_000_000_000 // self.sample_rate
+        played_ns = samples * 1_000_000_000 // self.sample_rate
+        return played_ns + min(monotonic_ns() - stamp_ns, block_ns)
+
+    def _start_producer(self) -> None:
+        """Start the render thread (no-op if already running).
+
+        Waits briefly for the first block so the stream does not open on
+        an empty ring and underrun in its first callbacks.
+        """
+        if self._producer is not None and self._producer.is_alive():
+            return
+        self._producer_stop.clear()
+        self._producer = threading.Thread(target=self._producer_loop, daemon=True)
+        self._producer.start()
+        if not self._ring.wait_for_data(self.block_size, timeout=PREFILL_TIMEOUT):
+            logger.warning("Audio producer slow to start; playback may begin with silence")
+
+    def _stop_producer(self) -> None:
+        """Stop the render thread and drop any samples it left in the ring.
+
+        Also forgets the audio clock stamp, so playback_time_ns() reports no
+        clock after a restart until the first new callback has run.
+        """
+        self._producer_stop.set()
+        if self._producer is not None:
+            self._producer.join(timeout=1.0)
+            self._producer = None
+        self._ring.clear()
+        self._clock = None
 
     def start(self) -> bool:
         """Start continuous audio playback.
@@ -102,35 +223,20 @@ class LivePSGStream:
             return False
 
         if self.stream is not None:
-            logger.warning("Stream already running")
-            return True
+            return self._resume()
 
         try:
-            # Find a valid output device
-            device = None
-            try:
-                # Try to get default output device
-                default_out = sd.default.device[1]
-                if default_out is not None and default_out >= 0:
-                    device = default_out
-            except (AttributeError, IndexError, TypeError):
-                pass
-
-            # If no valid default, find first available output device
-            if device is None:
-                devices = sd.query_devices()
-                for idx, dev in enumerate(devices):
-                    if dev['max_output_channels'] > 0:
-                        device = idx
-                        logger.info(f"Using first available output device: {dev['name']}")
-                        break
-
+            device = self._find_output_device()
+            self._match_device_block_size(device)
+            self._start_producer()
             self.stream = sd.OutputStream(
                 device=device,  # None is ok - lets sounddevice choose
                 channels=1,
+                dtype="int16",
                 samplerate=self.sample_rate,
                 callback=self._callback,
                 blocksize=self.block_size,
+                latency="low",
             )
             self.stream.start()
             logger.info(f"Audio stream started on device {device}")
@@ -139,19 +245,103 @@ class LivePSGStream:
         except Exception as e:
             logger.error(f"Failed to start audio stream: {e}")
             self.stream = None
+            self._stop_producer()
             return False
 
+    def _resume(self) -> bool:
+        """Restart the stream kept open by a previous stop().
+
+        Returns:
+            True if the stream is running, False if it had to be released
+        """
+        if self.stream.active:
+            logger.warning("Stream already running")
+            return True
+        self._start_producer()
+        try:
+            self.stream.start()
+            logger.info("Audio stream restarted")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to restart audio stream: {e}")
+            self.close()
+            return False
+
+    def _match_device_block_size(self, device: Optional[int]) -> None:
+        """Shrink the block size to the device's low-latency period.
+
+        Devices deliver irregular callback sizes when asked for blocks much
+        larger than their native period. The period is rounded up to a power
+        of two, clamped to [MIN_BLOCK_SIZE, requested block size], and the
+        synth and ring buffers are reallocated to match.
+
+        Args:
+            device: Output device index, or None for the default device
+        """
+        try:
+            info = sd.query_devices(device, "output")
+            period = int(info["default_low_output_latency"] * self.sample_rate)
+        except Exception as e:
+            logger.warning(f"Could not query output latency, keeping block size: {e}")
+            return
+
+        block_size = 1 << max(period - 1, 0).bit_length()
+        block_size = min(self.block_size, max(MIN_BLOCK_SIZE, block_size))
+        if block_size == self.block_size:
+            return
+        logger.info(f"Using device block size {block_size} (requested {self.block_size})")
+        self.block_size = block_size
+        self.synth = PSGSynthesizer(self.sample_rate, block_size)
+        self._ring = PCMRingBuffer(block_size * 2, dtype=np.int16)
+        self._pcm = np.empty(block_size, dtype=np.int16)
+
+    @staticmethod
+    def _find_output_device() -> Optional[int]:
+        """Pick an output device index, or None to let sounddevice choose."""
+        try:
+            # Try to get default output device
+            default_out = sd.default.device[1]
+            if default_out is not None and default_out >= 0:
+                return default_out
+        except (AttributeError, IndexError, TypeError):
+            pass
+
+        # If no valid default, find first available output device
+        devices = sd.query_devices()
+        for idx, dev in enumerate(devices):
+            if dev["max_output_channels"] > 0:
+                logger.info(f"Using first available output device: {dev['name']}")
+                return idx
+        return None
+
     def stop(self) -> None:
-        """Stop audio playback."""
-        if self.stream is not None:
+        """Stop audio playback.
+
+        Pending output is discarded rather than drained, so playback stops
+        immediately. The underlying stream stays open so the next start()
+        can resume it without re-querying devices or reallocating PortAudio
+        buffers.
+        """
+        if self.stream is not None and self.stream.active:
             try:
-                self.stream.stop()
-                self.stream.close()
+                self.stream.abort()
                 logger.info("Audio stream stopped")
             except Exception as e:
                 logger.error(f"Error stopping stream: {e}")
+        self._stop_producer()
+
+    def close(self) -> None:
+        """Stop playback and release the underlying audio stream."""
+        if self.stream is not None:
+            try:
+                self.stream.abort()
+                self.stream.close()
+                logger.info("Audio stream closed")
+            except Exception as e:
+                logger.error(f"Error closing stream: {e}")
             finally:
                 self.stream = None
+        self._stop_producer()
 
     def is_playing(self) -> bool:
         """Check if stream is currently playing.
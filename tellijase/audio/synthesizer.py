@@ -2,10 +2,26 @@
 
 from __future__ import annotations
 
+from typing import Optional, Union
+
 import numpy as np
 
 from ..models import PSGState
-from ..psg.utils import CLOCK_HZ, period_to_frequency
+from ..psg.registers import R0, R1, R2, R3, R4, R5, R6, R7, R10, R11, R12
+from ..psg.utils import CLOCK_HZ, MAX_PERIOD
+from ._kernels import NUMBA_AVAILABLE, aligned_empty, lfsr_clocked_fill, psg_mix, warm_up
+
+# Per-channel (A/B/C) register indices and R7 mixer bits
+_FINE_REGS = [R0, R2, R4]
+_COARSE_REGS = [R1, R3, R5]
+_VOLUME_REGS = [R10, R11, R12]
+_TONE_BITS = np.array([0x01, 0x02, 0x04])
+_NOISE_BITS = np.array([0x08, 0x10, 0x20])
+
+# Fixed output gain: three channels at volume 15 sum to at most +/-45 levels,
+# so this maps the loudest possible mix to exactly +/-1.0. Loudness no longer
+# depends on how many channels happen to be playing.
+MIX_GAIN = np.float32(1.0 / (3 * 15))
 
 
 class PSGSynthesizer:
@@ -17,233 +33,281 @@ class PSGSynthesizer:
     - Volume applied to MIXED signal per channel
     """
 
-    def __init__(self, sample_rate: int = 44100):
+    def __init__(self, sample_rate: int = 44100, block_size: int = 2048):
+        """Initialize the synthesizer.
+
+        Args:
+            sample_rate: Audio sample rate in Hz
+            block_size: Expected samples per render_buffer() call; scratch
+                buffers are preallocated for it (and grown if a call asks for more)
+        """
         self.sample_rate = sample_rate
 
-        # Phase accumulators for continuity (prevents clicks on parameter changes)
-        self.phase_a = 0.0
-        self.phase_b = 0.0
-        self.phase_c = 0.0
-        self.noise_phase = 0.0
+        # Phase increments for every tone (12-bit) and noise (5-bit) period;
+        # the sample rate is fixed per instance, so renders only index these
+        self._tone_inc_table = self._increment_table(MAX_PERIOD + 1)
+        self._noise_inc_table = self._increment_table(32)
+        self._noise_inc_table[0] = 0  # Noise period 0: generator off
+        # 32-bit fixed-point phase accumulators for channels A/B/C, kept for
+        # continuity (prevents clicks on parameter changes)
+        self.phases = np.zeros(3, dtype=np.uint32)
+        self.noise_phase = 0  # Noise clock accumulator (2**32 = one LFSR step)
 
         # Noise LFSR state (17-bit)
         self.lfsr = 1
         self.lfsr_output = 1.0
 
-    def render_buffer(self, num_samples: int, state: PSGState) -> np.ndarray:
+        # Scratch buffers reused by every render, so rendering allocates no
+        # sample-sized arrays on the audio thread
+        self._allocate(block_size)
+
+        # Compile kernels now rather than in the first audio callback
+        warm_up()
+
+    def _allocate(self, block_size: int) -> None:
+        """(Re)allocate the per-render scratch buffers for ``block_size`` samples.
+
+        Buffers are cache-line aligned (see aligned_empty) so numpy's SIMD
+        loops and the Numba kernels can use aligned loads.
+        """
+        self.block_size = block_size
+        self._ramp = np.arange(block_size, dtype=np.uint32)
+        self._phase_buf = aligned_empty((3, block_size), np.uint32)
+        self._high_buf = aligned_empty((3, block_size), bool)
+        self._signal_buf = aligned_empty((3, block_size), np.int8)
+        self._level_buf = aligned_empty(block_size, np.int16)
+        self._noise_buf = aligned_empty(block_size, np.float32)
+        self._noise_high_buf = aligned_empty(block_size, bool)
+        self._mix_buf = aligned_empty(block_size, np.float32)
+
+    def render_buffer(self, num_samples: int, state: Union[PSGState, np.ndarray]) -> np.ndarray:
         """Generate mono PCM samples from current PSG state.
 
         Args:
             num_samples: Number of samples to generate
-            state: Current PSG state
+            state: Current PSG state, or its uint8[16] register array
+                (PSGState.to_register_array())
 
         Returns:
-            float32 array of samples in range [-1.0, 1.0]
+            float32 array of samples in range [-1.0, 1.0]. This is a view of
+            an internal buffer, overwritten by the next call - copy it out
+            before rendering again.
         """
-        regs = state.to_registers()
-        r7 = regs.get("R7", 0xFF)
-
-        # Generate shared noise waveform (used by all channels)
-        noise = self._generate_noise(num_samples, regs.get("R6", 0))
-
-        # Initialize mix buffer
-        mix = np.zeros(num_samples, dtype=np.float32)
-
-        # Process each channel with correct per-channel mixing
-        channels = [
-            (0, "R0", "R1", "R10", 0x01, 0x08, self.phase_a),  # Channel A
-            (1, "R2", "R3", "R11", 0x02, 0x10, self.phase_b),  # Channel B
-            (2, "R4", "R5", "R12", 0x04, 0x20, self.phase_c),  # Channel C
-        ]
-
-        for idx, fine_r, coarse_r, vol_r, tone_bit, noise_bit, phase in channels:
-            channel_signal = self._process_channel(
-                idx,
-                fine_r,
-                coarse_r,
-                vol_r,
-                tone_bit,
-                noise_bit,
-                phase,
-                r7,
-                regs,
-                noise,
-                num_samples,
-            )
-            if channel_signal is not None:
-                volume = regs.get(vol_r, 0) & 0x0F
-                amplitude = volume / 15.0
-                mix += channel_signal * amplitude
+        if num_samples > self.block_size:
+            self._allocate(num_samples)
+
+        regs = state if isinstance(state, np.ndarray) else state.to_register_array()
+        r7 = int(regs[R7])
+        noise_period = int(regs[R6])
+        volumes = regs[_VOLUME_REGS] & 0x0F
 
-        # Normalize to prevent clipping
-        max_val = np.max(np.abs(mix))
-        if max_val > 1.0:
-            mix = mix / max_val
+        # Check mixer enables (R7 uses inverted logic: 0=enabled, 1=disabled)
+        tone_enabled = (r7 & _TONE_BITS) == 0
+        noise_enabled = (r7 & _NOISE_BITS) == 0
+        active = tone_enabled | noise_enabled
+        if noise_period == 0:
+            # Noise-only channels are silent while the noise generator is off
+            active &= tone_enabled
+        # Channels at volume 0 are skipped entirely
+        active &= volumes > 0
+        channels = np.flatnonzero(active)
+
+        # 32-bit fixed-point phase increments; tone-disabled channels hold phase
+        increments = self._phase_increments(regs)
+        increments[~tone_enabled] = 0
+
+        # Already within [-1.0, 1.0]: the fixed gain leaves headroom for all
+        # three channels at full volume, so no normalization/clip pass
+        args = (
+            increments[channels],
+            volumes[channels],
+            tone_enabled[channels],
+            noise_enabled[channels],
+        )
+        # Run the shared noise generator only if an audible channel uses it
+        use_noise = bool(noise_enabled[channels].any())
+        if NUMBA_AVAILABLE:
+            mix = self._mix_compiled(
+                *args, use_noise, noise_period, self.phases[channels], num_samples
+            )
+        else:
+            noise = self._generate_noise(num_samples, noise_period) if use_noise else None
+            mix = self._mix_channels(*args, noise, self.phases[channels], num_samples)
 
-        return np.clip(mix, -1.0, 1.0).astype(np.float32)
+        # Advance every enabled tone, audible or not, for phase continuity
+        self.phases[:] = (self.phases + num_samples * increments) & 0xFFFFFFFF
+        return mix
 
-    def _process_channel(
+    def _mix_compiled(
         self,
-        idx: int,
-        fine_r: str,
-        coarse_r: str,
-        vol_r: str,
-        tone_bit: int,
-        noise_bit: int,
-        phase: float,
-        r7: int,
-        regs: dict,
-        noise: np.ndarray,
+        increments: np.ndarray,
+        volumes: np.ndarray,
+        tone_enabled: np.ndarray,
+        noise_enabled: np.ndarray,
+        use_noise: bool,
+        noise_period: int,
+        phases: np.ndarray,
         num_samples: int,
-    ) -> np.ndarray | None:
-        """Process a single PSG channel with tone+noise mixing.
+    ) -> np.ndarray:
+        """Numba version of _generate_noise + _mix_channels, fused per sample.
+
+        Produces the same output as the numpy path without materialising
+        (channels, samples) scratch arrays or a separate noise buffer.
 
         Args:
-            idx: Channel index (0=A, 1=B, 2=C)
-            fine_r: Fine period register name
-            coarse_r: Coarse period register name
-            vol_r: Volume register name
-            tone_bit: Tone enable bit mask for R7
-            noise_bit: Noise enable bit mask for R7
-            phase: Current phase for this channel
-            r7: Mixer register value
-            regs: All PSG registers
-            noise: Pre-generated noise waveform
+            increments: Tone phase increment (0 if tone disabled)
+            volumes: Volume level (1-15)
+            tone_enabled: Tone mixer enable
+            noise_enabled: Noise mixer enable
+            use_noise: Whether any audible channel uses the noise generator
+            noise_period: Noise period register value (0-31)
+            phases: Tone phase at the start of the buffer
             num_samples: Number of samples to generate
 
         Returns:
-            Channel signal or None if fully muted
+            float32 mix of the channels
         """
-        # Check mixer enables (R7 uses inverted logic: 0=enabled, 1=disabled)
-        tone_enabled = not bool(r7 & tone_bit)
-        noise_enabled = not bool(r7 & noise_bit)
-
-        if not tone_enabled and not noise_enabled:
-            return None  # Channel fully muted
-
-        # Hardware-accurate digital AND gating
-        # PSG treats tone/noise as digital signals (HIGH/LOW) and uses AND logic
-        if tone_enabled and noise_enabled:
-            # Both enabled: AND gate (output HIGH only when both are HIGH)
-            period = self._read_period(regs, fine_r, coarse_r)
-            freq = period_to_frequency(period)
-            if freq > 0:
-                tone, new_phase = self._generate_tone(num_samples, freq, phase)
-                self._update_phase(idx, new_phase)
-
-                # Digital AND: output is +1 only when BOTH tone and noise are +1
-                return np.where((tone > 0) & (noise > 0), 1.0, -1.0).astype(np.float32)
-            else:
-                return noise
-        elif tone_enabled:
-            # Tone only
-            period = self._read_period(regs, fine_r, coarse_r)
-            freq = period_to_frequency(period)
-            if freq > 0:
-                tone, new_phase = self._generate_tone(num_samples, freq, phase)
-                self._update_phase(idx, new_phase)
-                return tone
-            else:
-                return np.zeros(num_samples, dtype=np.float32)
-        else:
-            # Noise only
-            return noise
+        mix = self._mix_buf[:num_samples]
+        noise = (self.lfsr, self.noise_phase, self._noise_increment(noise_period))
+        self.lfsr, self.noise_phase = psg_mix(
+            mix,
+            increments,
+            volumes,
+            tone_enabled,
+            noise_enabled,
+            phases,
+            noise,
+            use_noise,
+            MIX_GAIN,
+        )
+        if use_noise and noise_period > 0:
+            self.lfsr_output = 1.0 if (self.lfsr & 1) else -1.0
+        return mix
 
-    def _update_phase(self, channel_idx: int, new_phase: float) -> None:
-        """Update phase accumulator for a channel.
+    def _mix_channels(
+        self,
+        increments: np.ndarray,
+        volumes: np.ndarray,
+        tone_enabled: np.ndarray,
+        noise_enabled: np.ndarray,
+        noise: Optional[np.ndarray],
+        phases: np.ndarray,
+        num_samples: int,
+    ) -> np.ndarray:
+        """Render and sum audible channels in one (channels, samples) pass.
 
-        Args:
-            channel_idx: Channel index (0=A, 1=B, 2=C)
-            new_phase: New phase value
-        """
-        if channel_idx == 0:
-            self.phase_a = new_phase
-        elif channel_idx == 1:
-            self.phase_b = new_phase
-        else:
-            self.phase_c = new_phase
+        Hardware-accurate digital AND gating: the PSG treats tone and noise
+        as HIGH/LOW signals, and a channel's output is HIGH only when every
+        enabled source is HIGH. The channel then swings +/-volume; the mix
+        is accumulated in integer levels and scaled by MIX_GAIN.
 
-    def _generate_tone(
-        self, num_samples: int, freq: float, phase: float
-    ) -> tuple[np.ndarray, float]:
-        """Generate square wave with phase continuity.
+        All array arguments hold one entry per audible channel.
 
         Args:
+            increments: Tone phase increment (0 if tone disabled)
+            volumes: Volume level (1-15)
+            tone_enabled: Tone mixer enable
+            noise_enabled: Noise mixer enable
+            noise: Pre-generated noise waveform, or None if no channel uses it
+            phases: Tone phase at the start of the buffer
             num_samples: Number of samples to generate
-            freq: Frequency in Hz
-            phase: Current phase (0.0-1.0)
 
         Returns:
-            Tuple of (waveform array, new phase)
+            float32 mix of the channels
         """
-        if freq <= 0:
-            return np.zeros(num_samples, dtype=np.float32), phase
+        mix = self._mix_buf[:num_samples]
+        count = increments.size
+        if count == 0:
+            mix.fill(0.0)
+            return mix
+
+        ramp = self._phase_buf[:count, :num_samples]
+        np.multiply(self._ramp[:num_samples], increments.astype(np.uint32)[:, None], out=ramp)
+        ramp += phases[:, None]
+
+        # Tone is HIGH while the top phase bit is clear
+        high = self._high_buf[:count, :num_samples]
+        np.less(ramp, 0x80000000, out=high)
+        high[~tone_enabled] = True
+        if noise is not None:
+            noise_high = np.greater(noise, 0, out=self._noise_high_buf[:num_samples])
+            np.logical_and(high, noise_high, out=high, where=noise_enabled[:, None])
+
+        # Integer mix: each channel is +/-volume (fits int8), summed in int16
+        # and converted to float once at the end
+        signals = self._signal_buf[:count, :num_samples]
+        np.copyto(signals, high)
+        signals *= 2
+        signals -= 1
+        signals *= volumes.astype(np.int8)[:, None]
+        levels = np.sum(signals, axis=0, out=self._level_buf[:num_samples])
+        return np.multiply(levels, MIX_GAIN, out=mix)
+
+    def _increment_table(self, size: int) -> np.ndarray:
+        """Tabulate 32-bit fixed-point phase steps for periods 0..size-1.
+
+        Period 0 behaves like period 1, as on the chip's tone counters.
 
-        phase_increment = freq / self.sample_rate
-        phases = np.arange(num_samples, dtype=np.float32) * phase_increment + phase
+        Args:
+            size: Number of period values
 
-        # Square wave: phase < 0.5 = high, >= 0.5 = low
-        wave = np.where((phases % 1.0) < 0.5, 1.0, -1.0).astype(np.float32)
+        Returns:
+            int64 array of increments (2**32 = one cycle)
+        """
+        periods = np.maximum(1, np.arange(size))
+        freqs = CLOCK_HZ / (32.0 * periods)
+        return (freqs / self.sample_rate * (1 << 32)).astype(np.int64) & 0xFFFFFFFF
 
-        # Update phase for next buffer
-        new_phase = (phases[-1] + phase_increment) % 1.0
+    def _phase_increments(self, regs: np.ndarray) -> np.ndarray:
+        """Per-sample phase steps for channels A/B/C (2**32 = one cycle).
 
-        return wave, new_phase
+        Args:
+            regs: Register array
 
-    def _generate_noise(self, num_samples: int, period: int) -> np.ndarray:
-        """Generate pseudo-random noise using LFSR.
+        Returns:
+            int64 array of 3 increments
+        """
+        fine = regs[_FINE_REGS].astype(np.int64)
+        coarse = regs[_COARSE_REGS].astype(np.int64) & 0x0F
+        return self._tone_inc_table[(coarse << 8) | fine]
 
-        The AY-3-8914 uses a 17-bit LFSR for noise generation.
-        For now, we use a simplified approach with numpy random.
+    def _noise_increment(self, period: int) -> int:
+        """Noise clock step per output sample in 32-bit fixed point (0 if off).
 
         Args:
-            num_samples: Number of samples to generate
             period: Noise period register value (0-31)
 
         Returns:
-            Noise waveform array
+            Accumulator increment, ``noise_freq / sample_rate * 2**32``
         """
-        if period == 0:
-            return np.zeros(num_samples, dtype=np.float32)
-
-        # Calculate noise frequency
-        noise_freq = CLOCK_HZ / (32.0 * period) if period > 0 else 0
+        return int(self._noise_inc_table[period & 0x1F])
 
-        if noise_freq <= 0:
-            return np.zeros(num_samples, dtype=np.float32)
-
-        # Simplified noise: update LFSR at noise frequency
-        samples_per_update = max(1, int(self.sample_rate / noise_freq))
-
-        noise = np.zeros(num_samples, dtype=np.float32)
-        for i in range(0, num_samples, samples_per_update):
-            # Simple 17-bit LFSR (taps at bits 17 and 14)
-            bit = ((self.lfsr >> 0) ^ (self.lfsr >> 3)) & 1
-            self.lfsr = (self.lfsr >> 1) | (bit << 16)
-            self.lfsr_output = 1.0 if (self.lfsr & 1) else -1.0
-
-            # Fill samples until next update
-            end = min(i + samples_per_update, num_samples)
-            noise[i:end] = self.lfsr_output
-
-        return noise
+    def _generate_noise(self, num_samples: int, period: int) -> np.ndarray:
+        """Generate noise from the 17-bit LFSR, clocked at the noise rate.
 
-    @staticmethod
-    def _read_period(regs: dict, fine_r: str, coarse_r: str) -> int:
-        """Read 12-bit period from fine and coarse registers.
+        The AY-3-8914 steps its LFSR (taps at bits 0 and 3) once per noise
+        clock. A fixed-point clock accumulator carried between buffers
+        decides on which samples it steps, so holds are exact and continue
+        seamlessly across buffer boundaries.
 
         Args:
-            regs: Register dict
-            fine_r: Fine period register name (e.g., 'R0')
-            coarse_r: Coarse period register name (e.g., 'R1')
+            num_samples: Number of samples to generate
+            period: Noise period register value (0-31)
 
         Returns:
-            12-bit period value (1-4095)
+            Noise waveform array
         """
-        fine = regs.get(fine_r, 0) & 0xFF
-        coarse = regs.get(coarse_r, 0) & 0x0F
-        period = (coarse << 8) | fine
-        return max(1, period)
+        noise = self._noise_buf[:num_samples]
+        if period == 0:
+            noise.fill(0.0)
+            return noise
+
+        self.lfsr, self.noise_phase = lfsr_clocked_fill(
+            noise, self.lfsr, self.noise_phase, self._noise_increment(period)
+        )
+        self.lfsr_output = 1.0 if (self.lfsr & 1) else -1.0
+
+        return noise
 
 
 __all__ = ["PSGSynthesizer"]
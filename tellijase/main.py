@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
+import functools
+import importlib
+import importlib.util
 import logging
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QAction
+from PySide6.QtCore import QSettings, QSignalBlocker, Qt, QTimer, Slot
+from PySide6.QtGui import QAction, QColor, QFont, QFontDatabase, QIntValidator, QPalette, QShowEvent
 from PySide6.QtWidgets import (
     QApplication,
     QComboBox,
     QFileDialog,
     QGroupBox,
     QHBoxLayout,
+    QInputDialog,
     QLabel,
     QLineEdit,
     QMainWindow,
@@ -23,6 +28,7 @@ from PySide6.QtWidgets import (
     QMenuBar,
     QMessageBox,
     QPushButton,
+    QScrollArea,
     QSlider,
     QStatusBar,
     QTabWidget,
@@ -31,9 +37,7 @@ from PySide6.QtWidgets import (
 )
 
 from tellijase import __version__
-from tellijase.audio.stream import LivePSGStream, SOUNDDEVICE_AVAILABLE
-from tellijase.audio.pygame_player import PygamePSGPlayer, PYGAME_AVAILABLE
-from tellijase.models import PSGState
+from tellijase.models import FRAME_FIELDS, FrameTrack, PSGChannel, PSGState
 from tellijase.storage import (
     JamSession,
     Project,
@@ -45,10 +49,228 @@ from tellijase.storage import (
 )
 from tellijase.ui.jam_controls import ChannelControl
 from tellijase.ui.timeline import FrameTimeline, FrameEditor
-from tellijase.psg.utils import frequency_to_period
+from tellijase.psg.utils import MAX_PERIOD, frequency_to_period, period_to_frequency
 
 logger = logging.getLogger(__name__)
 
+# Minimum interval between register display refreshes while dragging (~60 Hz)
+DISPLAY_REFRESH_MS = 16
+
+# Tab index of the JAM tab, which holds the register displays
+JAM_TAB_INDEX = 0
+
+# FRAME playback runs at NTSC frame rate. The timer period is rounded down;
+# frames are timed against the audio (or monotonic) clock, so the remainder
+# never drifts.
+FRAME_RATE = 60
+FRAME_INTERVAL_MS = 1000 // FRAME_RATE
+
+# Default audio buffer length: one frame, so each frame's register update
+# is heard within about a frame (overridable with the audio_latency_ms setting)
+DEFAULT_AUDIO_LATENCY_MS = 1000 / FRAME_RATE
+
+
+# Audio backends in order of preference: (name, module, player class,
+# availability flag). Each is imported on the first Play, not at startup.
+_AUDIO_BACKENDS = (
+    ("sounddevice", "tellijase.audio.stream", "LivePSGStream", "SOUNDDEVICE_AVAILABLE"),
+    ("pygame", "tellijase.audio.pygame_player", "PygamePSGPlayer", "PYGAME_AVAILABLE"),
+)
+
+# Timeline track order: channels A/B/C, noise, envelope
+_TRACK_CHANNEL_IDS = ("A", "B", "C", "N", "E")
+_CHANNEL_TRACK_INDEX = {channel_id: idx for idx, channel_id in enumerate(_TRACK_CHANNEL_IDS)}
+
+# Register input display, filled by register number with two-digit hex strings
+# (see _register_hex)
+_REGISTER_INPUT_FORMAT = "\n".join(
+    [
+        "Tone Periods:",
+        "  A: R0=${0} R1=${1}",
+        "  B: R2=${2} R3=${3}",
+        "  C: R4=${4} R5=${5}",
+        "",
+        "Noise: R6=${6}",
+        "Mixer: R7=${7}",
+        "",
+        "Volumes:",
+        "  A: R10=${10}",
+        "  B: R11=${11}",
+        "  C: R12=${12}",
+        "",
+        "Envelope:",
+        "  R13=${13} R14=${14}",
+        "  R15=${15}",
+    ]
+)
+
+
+# Register output display, filled per channel with (frequency, period,
+# volume, mix), then the noise line and R7
+_REGISTER_OUTPUT_FORMAT = "\n".join(
+    [
+        "Channel A: {0:6.1f} Hz (period={1})",
+        "  Volume: {2:2d}/15",
+        "  Mix: {3}",
+        "",
+        "Channel B: {4:6.1f} Hz (period={5})",
+        "  Volume: {6:2d}/15",
+        "  Mix: {7}",
+        "",
+        "Channel C: {8:6.1f} Hz (period={9})",
+        "  Volume: {10:2d}/15",
+        "  Mix: {11}",
+        "",
+        "{12}",
+        "",
+        "Mixer R7: {13:08b}b",  # Binary for clarity
+        "",
+        "Envelope: Not implemented",
+    ]
+)
+
+# Channel mix description, indexed by its R7 bits (tone off = 1, noise off = 2)
+_MIX_NAMES = ("Tone+Noise", "Noise", "Tone", "NONE")
+
+# Frequency of every 12-bit tone period (noise periods are a subset)
+_PERIOD_FREQUENCIES = tuple(period_to_frequency(p) for p in range(MAX_PERIOD + 1))
+
+# Noise control label for every 5-bit noise period
+_NOISE_LABELS = ("Period: 0 (OFF)",) + tuple(
+    f"Period: {p} (~{_PERIOD_FREQUENCIES[p]:.0f} Hz)" for p in range(1, 32)
+)
+
+# About dialog text (Qt rich text), built once at import
+_ABOUT_HTML = (
+    f"<h2>telliJASE v{__version__}</h2>"
+    "<p><b>J</b>ust <b>A</b> <b>S</b>ound <b>E</b>ditor "
+    "for the Intellivision AY-3-8914 PSG</p>"
+    "<p>Create custom music and sound effects using the General "
+    "Instrument AY-3-8914 Programmable Sound Generator chip found "
+    "in the Intellivision game console</p>"
+    "<p>© 2025-2026 Andrew Potozniak (Tyraziel & 1.z3r0)</p>"
+    "<p>Dual licensed under the "
+    "<a href='https://opensource.org/licenses/MIT'>MIT License</a> "
+    "and <a href='https://github.com/tyraziel/vibe-coder-license'>"
+    "VCL-0.1-Experimental</a></p>"
+    "<p><small>Intellivision and Intellivision trademarks are "
+    "the property of Atari Interactive, Inc. "
+    "This application is built to aid sound programming "
+    "for the Intellivision. "
+    "This project is not affiliated with or endorsed by "
+    "Atari Interactive, Inc.</small></p>"
+    "<p><i><a href='https://aiattribution.github.io/statements/"
+    "AIA-PAI-Nc-Hin-R-?model=Claude%20Code%20%5BSonnet%204.5%5D-v1.0'>"
+    "AIA PAI Nc Hin R Claude Code [Sonnet 4.5] v1.0</a></i></p>"
+)
+
+
+def _new_id(prefix: str) -> str:
+    """Return a unique id for a new session or song, e.g. "jam-<ns timestamp>"."""
+    return f"{prefix}-{time.time_ns()}"
+
+
+@functools.lru_cache(maxsize=None)
+def _register_font() -> QFont:
+    """Monospace font for the register displays, looked up once."""
+    font = QFontDatabase.systemFont(QFontDatabase.FixedFont)
+    font.setPointSize(9)
+    return font
+
+
+@functools.lru_cache(maxsize=64)
+def _decode_registers(regs: tuple) -> str:
+    """Decode a register file into the register output display text.
+
+    Cached per register tuple: looped playback revisits the same states.
+
+    Args:
+        regs: The 16 register values, indexed by register number
+
+    Returns:
+        Multi-line description of channels, noise, mixer and envelope
+    """
+    r7 = regs[7]
+    fields = []
+    for ch in range(3):
+        period = (regs[2 * ch + 1] << 8) | regs[2 * ch]
+        # R7 tone-off bit -> bit 0, noise-off bit -> bit 1
+        mixer = ((r7 >> ch) & 1) | ((r7 >> (ch + 2)) & 2)
+        fields += (_PERIOD_FREQUENCIES[period], period, regs[10 + ch] & 0x0F, _MIX_NAMES[mixer])
+
+    noise_period = regs[6]
+    if noise_period > 0:
+        noise_freq = _PERIOD_FREQUENCIES[noise_period]
+        fields.append(f"Noise: {noise_freq:6.1f} Hz (period={noise_period})")
+    else:
+        fields.append("Noise: OFF")
+    fields.append(r7)
+    return _REGISTER_OUTPUT_FORMAT.format(*fields)
+
+
+def _register_hex(regs: bytes) -> list:
+    """Format register bytes as uppercase two-digit hex strings.
+
+    One bytes.hex() call converts every register at once, rather than one
+    format spec per register.
+
+    Args:
+        regs: Register bytes (PSGState.to_register_array().tobytes())
+
+    Returns:
+        List of 16 strings such as "0F", indexed by register number
+    """
+    return regs.hex(" ").upper().split()
+
+
+def _make_register_display(color: str) -> QLabel:
+    """Create a dark monospace label for register/output values.
+
+    Colors come from a palette rather than a style sheet, so Qt does not
+    re-run its CSS engine when the label is repolished.
+
+    Args:
+        color: Text color (e.g. "#00ff00")
+
+    Returns:
+        Configured QLabel
+    """
+    label = QLabel()
+    label.setTextFormat(Qt.PlainText)  # Skip rich-text detection on every update
+    label.setFont(_register_font())
+    palette = label.palette()
+    palette.setColor(QPalette.Window, QColor("#1e1e1e"))
+    palette.setColor(QPalette.WindowText, QColor(color))
+    label.setPalette(palette)
+    label.setAutoFillBackground(True)
+    label.setContentsMargins(10, 10, 10, 10)
+    label.setWordWrap(False)
+    label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+    return label
+
+
+def _installed_audio_backends() -> list:
+    """Names of the audio backends whose library is installed.
+
+    Uses importlib.util.find_spec, which locates a package without importing it.
+    """
+    return [name for name, *_ in _AUDIO_BACKENDS if importlib.util.find_spec(name)]
+
+
+def _load_audio_backend(module: str, cls: str, flag: str):
+    """Import an audio backend module and return its player class.
+
+    Args:
+        module: Backend module name
+        cls: Player class name
+        flag: Name of the module's availability flag
+
+    Returns:
+        The player class, or None if the backend's library failed to load
+    """
+    backend = importlib.import_module(module)
+    return getattr(backend, cls) if getattr(backend, flag) else None
+
 
 class MainWindow(QMainWindow):
     """telliJASE main window with JAM + FRAME placeholders."""
@@ -61,50 +283,61 @@ class MainWindow(QMainWindow):
         self.current_state = PSGState()  # Live JAM state
         self.current_file: Optional[Path] = None
 
+        # Last directory used by the file dialogs (persisted across runs)
+        self.settings = QSettings("tellijase", "telliJASE")
+        self.last_dir = str(self.settings.value("last_dir", str(Path.home())))
+        self.audio_latency_ms = float(
+            self.settings.value("audio_latency_ms", DEFAULT_AUDIO_LATENCY_MS)
+        )
+
         # FRAME mode state
         self.current_song: Optional[Song] = None
-        # Timeline data: {"A": {frame: data}, "B": {frame: data}, ...}
-        self.timeline_data: dict[str, dict[int, dict]] = {
-            "A": {},
-            "B": {},
-            "C": {},
-            "N": {},
-            "E": {},  # Envelope
+        # Timeline data per track: A/B/C, noise and envelope
+        self.timeline_data: dict[str, FrameTrack] = {
+            channel_id: FrameTrack() for channel_id in _TRACK_CHANNEL_IDS
         }
+        # Last frame holding data on any track (0 if none), kept up to date
+        # by the edit handlers so playback ticks need not scan the tracks
+        self._timeline_end_frame = 0
+        # Playback handlers per track, built once: (track, apply(data)).
+        # Channels are looked up by index on each call, so the handlers stay
+        # valid when current_state is replaced. The envelope track has none.
+        self._frame_handlers = [
+            (self.timeline_data[channel_id], functools.partial(self._apply_channel_frame, idx))
+            for idx, channel_id in enumerate(_TRACK_CHANNEL_IDS[:3])
+        ]
+        self._frame_handlers.append((self.timeline_data["N"], self._apply_noise_frame))
 
         # Frame playback state
         self.playback_timer: Optional[QTimer] = None
         self.current_frame = 0
         self.is_playing = False
         self.playback_loop = False
+        # Playback clock: frames played since _playback_origin_ns (monotonic),
+        # and the audio clock reading matching that origin once known
+        self._playback_origin_ns = 0
+        self._audio_origin_ns: Optional[int] = None
+        self._frames_played = 0
 
         # UI widgets
         self.channel_controls: list[ChannelControl] = []
 
-        # Audio - try sounddevice first, fall back to pygame
+        # Coalesces bursts of slider changes into one register display
+        # refresh per frame; the PSG state itself is updated immediately
+        self._display_timer = QTimer(self)
+        self._display_timer.setSingleShot(True)
+        self._display_timer.setInterval(DISPLAY_REFRESH_MS)
+        self._display_timer.timeout.connect(self._update_register_display)
+        # Register values the displays currently show (None before the first refresh)
+        self._displayed_registers: Optional[tuple] = None
+        self._displayed_output = ""
+
+        # Audio - backends are imported and constructed on the first Play
+        # (see _start_audio); here we only check that one is installed
         self.audio_stream = None
         self.audio_backend = None
-        self.audio_available = False
-
-        # Try sounddevice (best for real-time)
-        if SOUNDDEVICE_AVAILABLE:
-            try:
-                self.audio_stream = LivePSGStream(self.current_state)
-                self.audio_backend = "sounddevice"
-                self.audio_available = True
-                logger.info("Audio initialized with sounddevice")
-            except Exception as e:
-                logger.warning(f"sounddevice failed: {e}, trying pygame...")
-
-        # Fall back to pygame if sounddevice failed
-        if not self.audio_available and PYGAME_AVAILABLE:
-            try:
-                self.audio_stream = PygamePSGPlayer(self.current_state)
-                self.audio_backend = "pygame"
-                self.audio_available = True
-                logger.info("Audio initialized with pygame.mixer")
-            except Exception as e:
-                logger.error(f"pygame audio failed: {e}")
+        self._audio_candidates = _installed_audio_backends()
+        self.audio_available = bool(self._audio_candidates)
 
         if not self.audio_available:
             logger.warning("No audio backend available")
@@ -120,9 +353,16 @@ class MainWindow(QMainWindow):
         self._update_title()
         self._initialize_jam_controls()
 
-        # Check audio availability after UI is ready
-        if not self.audio_available:
-            QTimer.singleShot(100, self._warn_audio_missing)
+        # The missing-audio warning is shown once, after the window first appears
+        self._audio_warning_shown = self.audio_available
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Warn about missing audio once the window is first shown."""
+        super().showEvent(event)
+        if not self._audio_warning_shown:
+            self._audio_warning_shown = True
+            # Queued so the dialog opens after the window has been painted
+            QTimer.singleShot(0, self._warn_audio_missing)
 
     # UI Construction -------------------------------------------------
     def _create_actions(self) -> None:
@@ -166,6 +406,7 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         self.tabs.addTab(self._build_jam_tab(), "JAM")
         self.tabs.addTab(self._build_frame_tab(), "FRAME")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         layout.addWidget(self.tabs)
 
         self.setCentralWidget(container)
@@ -222,7 +463,7 @@ class MainWindow(QMainWindow):
         noise_layout = QVBoxLayout(noise_group)
         noise_layout.setContentsMargins(20, 10, 20, 10)
 
-        self.noise_label = QLabel("Period: 1 (~111861 Hz)")
+        self.noise_label = QLabel(_NOISE_LABELS[1])
         noise_layout.addWidget(self.noise_label)
 
         # Horizontal layout with slider and text input
@@ -238,6 +479,9 @@ class MainWindow(QMainWindow):
         self.noise_input = QLineEdit()
         self.noise_input.setMaximumWidth(70)
         self.noise_input.setText("1")
+        # Only whole periods 0-31 are accepted, so editingFinished never
+        # delivers text that needs checking
+        self.noise_input.setValidator(QIntValidator(0, 31, self.noise_input))
         self.noise_input.editingFinished.connect(self._on_noise_input_changed)
 
         noise_row.addWidget(self.noise_slider)
@@ -262,14 +506,7 @@ class MainWindow(QMainWindow):
         input_layout.setContentsMargins(0, 0, 5, 0)
         input_layout.addWidget(QLabel("<i>Input (Register Values):</i>"))
 
-        self.register_input_display = QLabel()
-        self.register_input_display.setFont(QApplication.font("Monospace"))
-        self.register_input_display.setStyleSheet(
-            "background-color: #1e1e1e; color: #00ff00; padding: 10px; "
-            "font-family: monospace; font-size: 9pt;"
-        )
-        self.register_input_display.setWordWrap(False)
-        self.register_input_display.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        self.register_input_display = _make_register_display("#00ff00")
         input_layout.addWidget(self.register_input_display)
 
         # RIGHT: Output (decoded values)
@@ -278,14 +515,7 @@ class MainWindow(QMainWindow):
         output_layout.setContentsMargins(5, 0, 0, 0)
         output_layout.addWidget(QLabel("<i>Output (Actual Sound):</i>"))
 
-        self.register_output_display = QLabel()
-        self.register_output_display.setFont(QApplication.font("Monospace"))
-        self.register_output_display.setStyleSheet(
-            "background-color: #1e1e1e; color: #00aaff; padding: 10px; "
-            "font-family: monospace; font-size: 9pt;"
-        )
-        self.register_output_display.setWordWrap(False)
-        self.register_output_display.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        self.register_output_display = _make_register_display("#00aaff")
         output_layout.addWidget(self.register_output_display)
 
         io_row.addWidget(input_group)
@@ -360,8 +590,6 @@ class MainWindow(QMainWindow):
         content_layout = QHBoxLayout()
 
         # Timeline (scrollable)
-        from PySide6.QtWidgets import QScrollArea
-
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
@@ -388,34 +616,28 @@ class MainWindow(QMainWindow):
         self.btn_play.clicked.connect(self._on_play_audio)
         self.btn_stop.clicked.connect(self._on_stop_audio)
 
-        # Connect high-level channel signals to model updates
+        # Connect high-level channel signals to model updates. The channel
+        # index is bound once here; each slot looks the channel up on the
+        # current state, which is replaced when a session or project loads
         for idx, control in enumerate(self.channel_controls):
-            # Get the channel model
-            if idx == 0:
-                channel = self.current_state.channel_a
-            elif idx == 1:
-                channel = self.current_state.channel_b
-            else:
-                channel = self.current_state.channel_c
-
-            # Wire signals to model (direct field assignment + register display update)
-            control.frequency_changed.connect(
-                lambda freq, ch=channel: self._update_channel_param(ch, "frequency", freq)
-            )
-            control.volume_changed.connect(
-                lambda vol, ch=channel: self._update_channel_param(ch, "volume", vol)
-            )
-            control.tone_enabled_changed.connect(
-                lambda enabled, ch=channel: self._update_channel_param(ch, "tone_enabled", enabled)
-            )
-            control.noise_enabled_changed.connect(
-                lambda enabled, ch=channel: self._update_channel_param(ch, "noise_enabled", enabled)
-            )
+            control.frequency_changed.connect(functools.partial(self._on_channel_frequency, idx))
+            control.volume_changed.connect(functools.partial(self._on_channel_volume, idx))
+            control.tone_enabled_changed.connect(functools.partial(self._on_channel_tone, idx))
+            control.noise_enabled_changed.connect(functools.partial(self._on_channel_noise, idx))
 
     def _initialize_jam_controls(self) -> None:
         """Initialize JAM controls with current model state."""
-        for control in self.channel_controls:
-            control.emit_state()
+        # Copy control values straight into the model instead of emitting one
+        # signal per field, so the register display is rebuilt only once
+        channels = (
+            self.current_state.channel_a,
+            self.current_state.channel_b,
+            self.current_state.channel_c,
+        )
+        for control, channel in zip(self.channel_controls, channels):
+            for name, value in control.current_state().items():
+                setattr(channel, name, value)
+        self.current_state.noise_period = self.noise_slider.value()
 
         # Update register display with initial state
         self._update_register_display()
@@ -432,7 +654,8 @@ class MainWindow(QMainWindow):
             self.jam_status_label.setText("⚠️ Audio unavailable (no backend found)")
             self.jam_status_label.setStyleSheet("color: orange; font-weight: bold;")
         else:
-            self.jam_status_label.setText(f"Audio: {self.audio_backend}")
+            backend = self.audio_backend or self._audio_candidates[0]
+            self.jam_status_label.setText(f"Audio: {backend}")
             self.jam_status_label.setStyleSheet("color: green;")
 
     def _make_action(self, text: str, shortcut: str, handler) -> QAction:
@@ -442,6 +665,7 @@ class MainWindow(QMainWindow):
         return action
 
     # File Handling ---------------------------------------------------
+    @Slot()
     def new_project(self) -> None:
         """Create a new project with default PSG state."""
         self.project = new_project()
@@ -451,12 +675,13 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage("Created new project", 3000)
         self._update_title()
 
+    @Slot()
     def open_project(self) -> None:
         """Open a project file from disk."""
         filename, _ = QFileDialog.getOpenFileName(
             self,
             "Open telliJASE Project",
-            "",
+            self.last_dir,
             "telliJASE Projects (*.tellijase);;All Files (*)",
         )
         if not filename:
@@ -464,6 +689,7 @@ class MainWindow(QMainWindow):
         try:
             self.project = load_project(filename)
             self.current_file = Path(filename)
+            self._remember_dir(self.current_file)
             self.current_state = PSGState()  # Fresh state
             self._initialize_jam_controls()
             self.statusBar().showMessage(f"Opened {filename}", 3000)
@@ -471,6 +697,7 @@ class MainWindow(QMainWindow):
         except Exception as exc:  # pragma: no cover - UI popup
             QMessageBox.critical(self, "Open Failed", str(exc))
 
+    @Slot()
     def save_project(self) -> None:
         if self.current_file is None:
             self.save_project_as()
@@ -481,11 +708,12 @@ class MainWindow(QMainWindow):
         except Exception as exc:  # pragma: no cover - UI popup
             QMessageBox.critical(self, "Save Failed", str(exc))
 
+    @Slot()
     def save_project_as(self) -> None:
         filename, _ = QFileDialog.getSaveFileName(
             self,
             "Save telliJASE Project",
-            "",
+            self.last_dir,
             "telliJASE Projects (*.tellijase);;All Files (*)",
         )
         if not filename:
@@ -495,37 +723,21 @@ class MainWindow(QMainWindow):
             path = path.with_suffix(".tellijase")
         try:
             self.current_file = save_project(self.project, path)
+            self._remember_dir(self.current_file)
             self.statusBar().showMessage(f"Saved {self.current_file}", 3000)
             self._update_title()
         except Exception as exc:  # pragma: no cover - UI popup
             QMessageBox.critical(self, "Save Failed", str(exc))
 
+    def _remember_dir(self, path: Path) -> None:
+        """Store the directory of a project file as the next dialog start dir."""
+        self.last_dir = str(path.parent)
+        self.settings.setValue("last_dir", self.last_dir)
+
+    @Slot()
     def show_about(self) -> None:
         """Show about dialog."""
-        QMessageBox.about(
-            self,
-            "About telliJASE",
-            f"<h2>telliJASE v{__version__}</h2>"
-            "<p><b>J</b>ust <b>A</b> <b>S</b>ound <b>E</b>ditor "
-            "for the Intellivision AY-3-8914 PSG</p>"
-            "<p>Create custom music and sound effects using the General "
-            "Instrument AY-3-8914 Programmable Sound Generator chip found "
-            "in the Intellivision game console</p>"
-            "<p>© 2025-2026 Andrew Potozniak (Tyraziel & 1.z3r0)</p>"
-            "<p>Dual licensed under the "
-            "<a href='https://opensource.org/licenses/MIT'>MIT License</a> "
-            "and <a href='https://github.com/tyraziel/vibe-coder-license'>"
-            "VCL-0.1-Experimental</a></p>"
-            "<p><small>Intellivision and Intellivision trademarks are "
-            "the property of Atari Interactive, Inc. "
-            "This application is built to aid sound programming "
-            "for the Intellivision. "
-            "This project is not affiliated with or endorsed by "
-            "Atari Interactive, Inc.</small></p>"
-            "<p><i><a href='https://aiattribution.github.io/statements/"
-            "AIA-PAI-Nc-Hin-R-?model=Claude%20Code%20%5BSonnet%204.5%5D-v1.0'>"
-            "AIA PAI Nc Hin R Claude Code [Sonnet 4.5] v1.0</a></i></p>",
-        )
+        QMessageBox.about(self, "About telliJASE", _ABOUT_HTML)
 
     # JAM Mode Callbacks ----------------------------------------------
     def _refresh_session_list(self) -> None:
@@ -547,16 +759,16 @@ class MainWindow(QMainWindow):
 
         self.session_combo.blockSignals(False)
 
+    @Slot(int)
     def _on_session_selected(self, index: int) -> None:
         """Session dropdown selection changed."""
         # Just update UI to show which session is selected
         # Actual loading happens when Load button is clicked
         pass
 
+    @Slot()
     def _on_new_session(self) -> None:
         """Create a new JAM session with current state."""
-        from PySide6.QtWidgets import QInputDialog
-
         name, ok = QInputDialog.getText(
             self,
             "New JAM Session",
@@ -568,7 +780,7 @@ class MainWindow(QMainWindow):
         if not ok or not name.strip():
             return
 
-        new_id = f"jam-{datetime.utcnow().timestamp()}"
+        new_id = _new_id("jam")
         session = JamSession(
             id=new_id,
             name=name.strip(),
@@ -579,6 +791,7 @@ class MainWindow(QMainWindow):
         self._refresh_session_list()
         self.statusBar().showMessage(f"Created session: {session.name}", 3000)
 
+    @Slot()
     def _on_save_current_session(self) -> None:
         """Save current PSG state to the selected session."""
         if not self.project.jam_sessions:
@@ -591,10 +804,11 @@ class MainWindow(QMainWindow):
 
         session = self.project.jam_sessions[index]
         session.registers = self.current_state.to_registers()
-        session.updated = datetime.utcnow().isoformat()
+        session.updated = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
         self.project.touch()
         self.statusBar().showMessage(f"Saved to session: {session.name}", 3000)
 
+    @Slot()
     def _on_load_session(self) -> None:
         """Load selected session into current JAM controls."""
         if not self.project.jam_sessions:
@@ -625,8 +839,8 @@ class MainWindow(QMainWindow):
                 noise_enabled=channel.noise_enabled,
             )
 
-        # Update noise control
-        self.noise_slider.setValue(self.current_state.noise_period)
+        # Update noise controls (the register display is refreshed once below)
+        self._show_noise_period(self.current_state.noise_period)
 
         # Update register display
         self._update_register_display()
@@ -653,16 +867,16 @@ class MainWindow(QMainWindow):
 
         self.sequence_combo.blockSignals(False)
 
+    @Slot(int)
     def _on_sequence_selected(self, index: int) -> None:
         """Sequence dropdown selection changed."""
         # Just update UI to show which sequence is selected
         # Actual loading happens when Load button is clicked
         pass
 
+    @Slot()
     def _on_new_sequence(self) -> None:
         """Create a new FRAME sequence."""
-        from PySide6.QtWidgets import QInputDialog
-
         name, ok = QInputDialog.getText(
             self,
             "New Sequence",
@@ -674,7 +888,7 @@ class MainWindow(QMainWindow):
         if not ok or not name.strip():
             return
 
-        new_id = f"song-{datetime.utcnow().timestamp()}"
+        new_id = _new_id("song")
         song = Song(
             id=new_id,
             name=name.strip(),
@@ -687,6 +901,7 @@ class MainWindow(QMainWindow):
         self._refresh_sequence_list()
         self.statusBar().showMessage(f"Created sequence: {song.name}", 3000)
 
+    @Slot()
     def _on_save_current_sequence(self) -> None:
         """Save current timeline to the selected sequence."""
         if not self.project.songs:
@@ -701,38 +916,33 @@ class MainWindow(QMainWindow):
 
         # Convert timeline_data to TrackEvent objects
         song.tracks = {}
-        for channel_id, frames in self.timeline_data.items():
-            if not frames:
+        event_count = 0
+        for channel_id, track in self.timeline_data.items():
+            if not len(track):
                 continue  # Skip empty tracks
 
-            events = []
-            for frame_num, data in sorted(frames.items()):
-                # Convert frequency to period for storage
-                period = None
-                if data.get("frequency") is not None:
-                    period = frequency_to_period(data["frequency"])
-
-                event = TrackEvent(
+            # records() yields frames already in order, with no sort or dicts
+            events = [
+                TrackEvent(
                     frame=frame_num,
                     duration=1,  # Default 1 frame duration
-                    period=period,
-                    volume=data.get("volume"),
+                    # Frequency is stored as a period
+                    period=None if frequency is None else frequency_to_period(frequency),
+                    volume=volume,
                     noise_period=None,  # Handled by noise track
-                    noise=data.get("noise_enabled"),
+                    noise=noise_enabled,
                 )
-                events.append(event)
+                for frame_num, frequency, volume, _, noise_enabled in track.records()
+            ]
 
             if events:
                 song.tracks[channel_id] = events
+                event_count += len(events)
 
-        song.updated = datetime.utcnow().isoformat()  # type: ignore
         self.project.touch()
-        self.statusBar().showMessage(
-            f"Saved {sum(len(e) for e in song.tracks.values())} "
-            f"events to sequence: {song.name}",
-            3000,
-        )
+        self.statusBar().showMessage(f"Saved {event_count} events to sequence: {song.name}", 3000)
 
+    @Slot()
     def _on_load_sequence(self) -> None:
         """Load selected sequence into timeline."""
         if not self.project.songs:
@@ -745,69 +955,78 @@ class MainWindow(QMainWindow):
         song = self.project.songs[index]
         self.current_song = song
 
+        # Suspend repaints so clearing and filling the cells costs one paint
+        self.timeline.setUpdatesEnabled(False)
+        try:
+            event_count = self._populate_timeline(song)
+        finally:
+            self.timeline.setUpdatesEnabled(True)
+
+        self.statusBar().showMessage(
+            f"Loaded {event_count} events from sequence: {song.name}", 3000
+        )
+
+    def _populate_timeline(self, song: Song) -> int:
+        """Replace the timeline data and cells with a song's track events.
+
+        Args:
+            song: Song to show
+
+        Returns:
+            Number of events loaded
+        """
         # Clear existing timeline data
-        for channel_id in self.timeline_data:
-            self.timeline_data[channel_id] = {}
+        for track in self.timeline_data.values():
+            track.clear()
 
         # Clear timeline UI
-        for track_idx in range(5):
-            for frame_num in range(128):
-                self.timeline.set_frame_data(track_idx, frame_num, None)
+        self.timeline.clear_all()
 
-        # Load TrackEvents into timeline_data
+        # Load each track's TrackEvents in bulk: fill the FrameTrack arrays
+        # column by column, then hand the decoded frames to the timeline
         event_count = 0
         for channel_id, events in song.tracks.items():
-            for event in events:
+            track = self.timeline_data[channel_id]
+            track.set_many(
+                [event.frame for event in events],
                 # Convert period back to frequency
-                frequency = None
-                if event.period is not None:
-                    from tellijase.psg.utils import period_to_frequency
-
-                    frequency = period_to_frequency(event.period)
-
-                # Build frame data
-                data = {
-                    "frequency": frequency,
-                    "volume": event.volume,
-                    "tone_enabled": event.period is not None,  # Has tone if period set
-                    "noise_enabled": event.noise,
-                }
-
-                # Store in timeline_data
-                self.timeline_data[channel_id][event.frame] = data
-
-                # Update timeline UI with visualization
-                track_idx = {"A": 0, "B": 1, "C": 2, "N": 3, "E": 4}.get(channel_id, 0)
-                self.timeline.set_frame_data(track_idx, event.frame, data)
-
-                event_count += 1
-
-        self.statusBar().showMessage(
-            f"Loaded {event_count} events from sequence: {song.name}", 3000
+                [None if e.period is None else period_to_frequency(e.period) for e in events],
+                [event.volume for event in events],
+                [event.period is not None for event in events],  # Has tone if period set
+                [event.noise for event in events],
+            )
+            track_idx = _CHANNEL_TRACK_INDEX.get(channel_id, 0)
+            self.timeline.set_track_data(track_idx, track.items())
+            event_count += len(events)
+        self._refresh_timeline_end()
+        return event_count
+
+    def _refresh_timeline_end(self) -> None:
+        """Recompute the last frame holding data on any track."""
+        self._timeline_end_frame = max(
+            0, *(track.last_frame() for track in self.timeline_data.values())
         )
 
-    def _track_index_to_channel_id(self, track_index: int) -> str:
-        """Convert track index to channel ID."""
-        mapping = {0: "A", 1: "B", 2: "C", 3: "N", 4: "E"}
-        return mapping.get(track_index, "A")
-
+    @Slot(int, int)
     def _on_frame_clicked(self, track_index: int, frame_number: int) -> None:
         """Frame cell clicked - open editor for that frame."""
         self.frame_editor.set_frame(track_index, frame_number)
 
         # Load existing frame data if present
-        channel_id = self._track_index_to_channel_id(track_index)
+        channel_id = _TRACK_CHANNEL_IDS[track_index]
         frame_data = self.timeline_data[channel_id].get(frame_number)
         self.frame_editor.load_frame_data(frame_data)
 
         self.statusBar().showMessage(f"Editing Track {track_index} Frame {frame_number}", 2000)
 
+    @Slot(int, int, dict)
     def _on_frame_applied(self, track_index: int, frame_number: int, data: dict) -> None:
         """Frame data applied - store in timeline and update UI."""
-        channel_id = self._track_index_to_channel_id(track_index)
+        channel_id = _TRACK_CHANNEL_IDS[track_index]
 
         # Store frame data
-        self.timeline_data[channel_id][frame_number] = data
+        self.timeline_data[channel_id].set(frame_number, data)
+        self._timeline_end_frame = max(self._timeline_end_frame, frame_number)
 
         # Update timeline cell with visualization
         self.timeline.set_frame_data(track_index, frame_number, data)
@@ -816,13 +1035,15 @@ class MainWindow(QMainWindow):
             f"Applied frame data to Track {track_index} Frame {frame_number}", 2000
         )
 
+    @Slot(int, int)
     def _on_frame_cleared(self, track_index: int, frame_number: int) -> None:
         """Frame cleared - remove from timeline."""
-        channel_id = self._track_index_to_channel_id(track_index)
+        channel_id = _TRACK_CHANNEL_IDS[track_index]
 
         # Remove frame data if it exists
-        if frame_number in self.timeline_data[channel_id]:
-            del self.timeline_data[channel_id][frame_number]
+        self.timeline_data[channel_id].remove(frame_number)
+        if frame_number >= self._timeline_end_frame:
+            self._refresh_timeline_end()
 
         # Update timeline cell to show empty
         self.timeline.set_frame_data(track_index, frame_number, None)
@@ -832,6 +1053,7 @@ class MainWindow(QMainWindow):
 
         self.statusBar().showMessage(f"Cleared Track {track_index} Frame {frame_number}", 2000)
 
+    @Slot(int)
     def _on_frames_copied(self, count: int) -> None:
         """Handle frames copied to clipboard.
 
@@ -840,67 +1062,57 @@ class MainWindow(QMainWindow):
         """
         self.statusBar().showMessage(f"Copied {count} frame(s)", 2000)
 
+    @Slot(list)
     def _on_frames_pasted(self, clipboard_data: list) -> None:
         """Handle pasted frames from clipboard.
 
         Args:
             clipboard_data: List of (track_idx, frame_num, data) tuples
         """
+        # Store frame data
         for track_idx, original_frame, data in clipboard_data:
-            channel_id = self._track_index_to_channel_id(track_idx)
+            channel_id = _TRACK_CHANNEL_IDS[track_idx]
+            self.timeline_data[channel_id].set(original_frame, data)
 
-            # Store frame data copy
-            self.timeline_data[channel_id][original_frame] = data.copy()
-
-            # Update timeline cell with visualization
-            self.timeline.set_frame_data(track_idx, original_frame, data)
+        # Update the timeline cells in one batch
+        self.timeline.set_frames_data(clipboard_data)
 
+        if clipboard_data:
+            last_pasted = max(frame for _, frame, _ in clipboard_data)
+            self._timeline_end_frame = max(self._timeline_end_frame, last_pasted)
         self.statusBar().showMessage(f"Pasted {len(clipboard_data)} frame(s)", 2000)
 
     # Frame Playback Engine -------------------------------------------
+    @Slot()
     def _on_frame_play(self) -> None:
         """Start frame playback."""
         if not self.audio_available:
             self._warn_audio_missing()
             return
 
-        # Try current backend (same logic as JAM mode)
-        if self.audio_stream and self.audio_stream.start():
+        previous = self.audio_backend
+        if self._start_audio():
             self._start_frame_playback()
+            if previous not in (None, self.audio_backend):
+                self.statusBar().showMessage(f"Playing with {self.audio_backend} (fallback)...", 0)
             return
 
-        # Current backend failed - try fallback to pygame
-        if self.audio_backend == "sounddevice" and PYGAME_AVAILABLE:
-            logger.warning("sounddevice failed to start, falling back to pygame")
-            try:
-                self.audio_stream = PygamePSGPlayer(self.current_state)
-                self.audio_backend = "pygame"
-                if self.audio_stream.start():
-                    self._start_frame_playback()
-                    self.statusBar().showMessage("Playing with pygame (fallback)...", 0)
-                    return
-            except Exception as e:
-                logger.error(f"pygame fallback failed: {e}")
-
         # All backends failed
-        QMessageBox.warning(
-            self,
-            "Playback Failed",
-            f"Failed to start audio with {self.audio_backend}.\n\n"
-            "Check console for errors. Audio may not be available in this environment.",
-        )
+        self._warn_playback_failed()
 
     def _start_frame_playback(self) -> None:
         """Start the frame playback timer (separated for reuse)."""
         # Create playback timer if needed
         if self.playback_timer is None:
             self.playback_timer = QTimer(self)
+            self.playback_timer.setTimerType(Qt.PreciseTimer)
             self.playback_timer.timeout.connect(self._advance_frame)
 
-        # Calculate frame interval (60 frames/sec NTSC timing)
-        frames_per_second = 60
-        ms_per_frame = int(1000 / frames_per_second)
-        self.playback_timer.start(ms_per_frame)
+        # Frames are due relative to now (resuming continues at current_frame)
+        self._playback_origin_ns = time.monotonic_ns()
+        self._audio_origin_ns = None
+        self._frames_played = 0
+        self.playback_timer.start(FRAME_INTERVAL_MS)
 
         self.is_playing = True
         self.btn_frame_play.setEnabled(False)
@@ -908,6 +1120,7 @@ class MainWindow(QMainWindow):
         self.btn_frame_stop.setEnabled(True)
         self.statusBar().showMessage("Playing...", 0)
 
+    @Slot()
     def _on_frame_pause(self) -> None:
         """Pause frame playback."""
         if self.playback_timer:
@@ -918,6 +1131,7 @@ class MainWindow(QMainWindow):
         self.btn_frame_pause.setEnabled(False)
         self.statusBar().showMessage(f"Paused at frame {self.current_frame}", 0)
 
+    @Slot()
     def _on_frame_stop(self) -> None:
         """Stop frame playback and reset."""
         if self.playback_timer:
@@ -934,7 +1148,7 @@ class MainWindow(QMainWindow):
         self.timeline.set_playback_position(-1)
 
         # Reset PSG state
-        self.current_state = PSGState()
+        self.current_state.reset()
         self._update_register_display()
 
         self.btn_frame_play.setEnabled(True)
@@ -942,247 +1156,283 @@ class MainWindow(QMainWindow):
         self.btn_frame_stop.setEnabled(False)
         self.statusBar().showMessage("Stopped")
 
+    @Slot(bool)
     def _on_frame_loop_toggled(self, checked: bool) -> None:
         """Toggle loop mode."""
         self.playback_loop = checked
 
+    @Slot()
     def _advance_frame(self) -> None:
-        """Advance to next frame and update PSG state."""
-        # Apply frame data to PSG state for each channel
-        for channel_id, frames in self.timeline_data.items():
-            if self.current_frame in frames:
-                data = frames[self.current_frame]
-
-                if channel_id == "A":
-                    self._apply_frame_to_channel(self.current_state.channel_a, data)
-                elif channel_id == "B":
-                    self._apply_frame_to_channel(self.current_state.channel_b, data)
-                elif channel_id == "C":
-                    self._apply_frame_to_channel(self.current_state.channel_c, data)
-                elif channel_id == "N":
-                    # Apply noise period
-                    if data.get("volume") is not None:
-                        # Use volume as noise period for noise track
-                        self.current_state.noise_period = data.get("volume", 1)
+        """Play the frames that are due by the playback clock.
 
-        # Update register display
-        self._update_register_display()
+        Frames are timed from the start of playback (see _playback_elapsed_ns)
+        rather than by counting timer ticks, so the rounded timer period and
+        tick jitter do not accumulate. A late tick plays every frame it
+        missed, so no frame data is skipped.
+        """
+        elapsed_ns = self._playback_elapsed_ns()
+        due = elapsed_ns * FRAME_RATE // 1_000_000_000 + 1
+        if self._frames_played >= due:
+            return  # Tick came early; the next frame is not due yet
+
+        # Loop state lives in locals and is written back once after the loop
+        apply_frame = self._apply_frame
+        end_frame = self._timeline_end_frame
+        next_frame = self.current_frame
+        changed = False
+        for _ in range(due - self._frames_played):
+            frame = next_frame
+            changed |= apply_frame(frame)
+
+            # Advance frame counter, stopping or looping at the end of the timeline
+            next_frame = frame + 1
+            if next_frame > end_frame:
+                if not self.playback_loop:
+                    self._on_frame_stop()
+                    return
+                next_frame = 0
+        self._frames_played = due
+        self.current_frame = next_frame
+
+        # Update register display (and audio) only if a frame changed anything
+        if changed:
+            self._update_register_display()
 
         # Highlight current playback position
-        self.timeline.set_playback_position(self.current_frame)
+        self.timeline.set_playback_position(frame)
 
-        # Advance frame counter
-        self.current_frame += 1
+    def _playback_elapsed_ns(self) -> int:
+        """Time since playback started or resumed, in nanoseconds.
 
-        # Check for end of timeline
-        max_frame = max(
-            (max(frames.keys()) if frames else 0 for frames in self.timeline_data.values()),
-            default=0,
-        )
+        Follows the audio backend's clock when it has one, so frames stay
+        in step with the audio device rather than the system clock; falls
+        back to time.monotonic_ns() otherwise.
+        """
+        now_ns = time.monotonic_ns()
+        audio_ns = self.audio_stream.playback_time_ns() if self.audio_stream else None
+        if audio_ns is None:
+            return now_ns - self._playback_origin_ns
+        if self._audio_origin_ns is None:
+            # First audio clock reading: align it with the time already elapsed
+            self._audio_origin_ns = audio_ns - (now_ns - self._playback_origin_ns)
+        return audio_ns - self._audio_origin_ns
+
+    def _apply_frame(self, frame: int) -> bool:
+        """Apply every track's data at ``frame`` to the PSG state.
 
-        if self.current_frame > max_frame:
-            if self.playback_loop:
-                self.current_frame = 0
-            else:
-                self._on_frame_stop()
+        Args:
+            frame: Frame number
+
+        Returns:
+            True if any track had data at that frame
+        """
+        changed = False
+        for track, apply in self._frame_handlers:
+            fields = track.fields(frame)
+            if fields is not None:
+                changed = True
+                apply(fields)
+        return changed
 
-    def _apply_frame_to_channel(self, channel, data: dict) -> None:
-        """Apply frame data to a PSG channel.
+    def _apply_channel_frame(self, idx: int, fields: tuple) -> None:
+        """Apply a tone track frame to channel A/B/C (index 0-2).
 
         Args:
-            channel: PSGChannel to update
-            data: Frame data dict
+            idx: Channel index
+            fields: Frame data tuple (see FrameTrack.fields); None leaves a
+                channel attribute unchanged
         """
-        if data.get("frequency") is not None:
-            channel.frequency = data["frequency"]
-        if data.get("volume") is not None:
-            channel.volume = data["volume"]
-        if data.get("tone_enabled") is not None:
-            channel.tone_enabled = data["tone_enabled"]
-        if data.get("noise_enabled") is not None:
-            channel.noise_enabled = data["noise_enabled"]
-
+        channel = self._channel(idx)
+        # FRAME_FIELDS are also the PSGChannel attribute names
+        for name, value in zip(FRAME_FIELDS, fields):
+            if value is not None:
+                setattr(channel, name, value)
+
+    def _apply_noise_frame(self, fields: tuple) -> None:
+        """Apply a noise track frame: its volume field holds the noise period."""
+        volume = fields[1]
+        if volume is not None:
+            self.current_state.noise_period = volume
+
+    @Slot(int)
     def _on_noise_slider_changed(self, value: int) -> None:
         """Noise period slider changed - update text input and PSG state."""
-        self.current_state.noise_period = value
-        self.noise_input.blockSignals(True)
-        self.noise_input.setText(str(value))
-        self.noise_input.blockSignals(False)
-        if value == 0:
-            self.noise_label.setText("Period: 0 (OFF)")
-        else:
-            # Show period value and approximate frequency
-            from tellijase.psg.utils import CLOCK_HZ
-
-            freq = CLOCK_HZ / (32.0 * value) if value > 0 else 0
-            self.noise_label.setText(f"Period: {value} (~{freq:.0f} Hz)")
-        self._update_register_display()
+        self._set_noise_period(value)
+        self._schedule_register_display()
 
+    @Slot()
     def _on_noise_input_changed(self) -> None:
         """Noise period text input changed - update slider and PSG state."""
-        try:
-            value = int(self.noise_input.text())
-            # Clamp to valid range (0-31)
-            value = max(0, min(31, value))
-            self.noise_slider.blockSignals(True)
-            self.noise_slider.setValue(value)
-            self.noise_slider.blockSignals(False)
-            self.noise_input.setText(str(value))  # Show clamped value
-            self.current_state.noise_period = value
-            if value == 0:
-                self.noise_label.setText("Period: 0 (OFF)")
-            else:
-                from tellijase.psg.utils import CLOCK_HZ
+        self._set_noise_period(int(self.noise_input.text()))  # Validated 0-31
+        self._update_register_display()
 
-                freq = CLOCK_HZ / (32.0 * value) if value > 0 else 0
-                self.noise_label.setText(f"Period: {value} (~{freq:.0f} Hz)")
-            self._update_register_display()
-        except ValueError:
-            # Invalid input - restore from slider
-            self.noise_input.setText(str(self.noise_slider.value()))
+    def _set_noise_period(self, value: int) -> None:
+        """Store a noise period in the PSG state and show it on the noise controls.
 
-    def _update_channel_param(self, channel, param_name: str, value) -> None:
-        """Update a channel parameter and refresh register display.
+        Shared by the slider and text input handlers; no change signals are
+        emitted, so neither handler re-enters the other.
 
         Args:
-            channel: PSGChannel to update
-            param_name: Name of the parameter to set
-            value: New value
+            value: Noise period (0-31)
         """
-        setattr(channel, param_name, value)
-        self._update_register_display()
+        self.current_state.noise_period = value
+        self._show_noise_period(value)
 
-    def _update_register_display(self) -> None:
-        """Update the register value display with current PSG state."""
-        from tellijase.psg.utils import period_to_frequency
+    def _show_noise_period(self, value: int) -> None:
+        """Show a noise period on the slider, text input and label without
+        emitting their change signals.
 
-        regs = self.current_state.to_registers()
+        Args:
+            value: Noise period (0-31)
+        """
+        with QSignalBlocker(self.noise_slider), QSignalBlocker(self.noise_input):
+            self.noise_slider.setValue(value)
+            self.noise_input.setText(str(value))
+        # Period value and approximate frequency, or OFF for period 0
+        self.noise_label.setText(_NOISE_LABELS[value])
 
-        # LEFT: Input (raw register values)
-        input_lines = []
-        input_lines.append("Tone Periods:")
-        input_lines.append(f"  A: R0=${regs.get('R0', 0):02X} R1=${regs.get('R1', 0):02X}")
-        input_lines.append(f"  B: R2=${regs.get('R2', 0):02X} R3=${regs.get('R3', 0):02X}")
-        input_lines.append(f"  C: R4=${regs.get('R4', 0):02X} R5=${regs.get('R5', 0):02X}")
-        input_lines.append("")
-        input_lines.append(f"Noise: R6=${regs.get('R6', 0):02X}")
-        input_lines.append(f"Mixer: R7=${regs.get('R7', 0xFF):02X}")
-        input_lines.append("")
-        input_lines.append("Volumes:")
-        input_lines.append(f"  A: R10=${regs.get('R10', 0):02X}")
-        input_lines.append(f"  B: R11=${regs.get('R11', 0):02X}")
-        input_lines.append(f"  C: R12=${regs.get('R12', 0):02X}")
-        input_lines.append("")
-        input_lines.append("Envelope:")
-        input_lines.append(f"  R13=${regs.get('R13', 0):02X} R14=${regs.get('R14', 0):02X}")
-        input_lines.append(f"  R15=${regs.get('R15', 0):02X}")
-
-        self.register_input_display.setText("\n".join(input_lines))
+    def _publish_registers(self, regs) -> None:
+        """Hand the current register file to the audio backend, if any.
 
-        # RIGHT: Output (decoded values)
-        output_lines = []
-
-        # Decode mixer
-        r7 = regs.get("R7", 0xFF)
-
-        # Channel A
-        period_a = (regs.get("R1", 0) << 8) | regs.get("R0", 0)
-        freq_a = period_to_frequency(period_a)
-        vol_a = regs.get("R10", 0) & 0x0F
-        tone_a = "Tone" if not (r7 & 0x01) else ""
-        noise_a = "Noise" if not (r7 & 0x08) else ""
-        mix_a = "+".join(filter(None, [tone_a, noise_a])) or "NONE"
-
-        output_lines.append(f"Channel A: {freq_a:6.1f} Hz (period={period_a})")
-        output_lines.append(f"  Volume: {vol_a:2d}/15")
-        output_lines.append(f"  Mix: {mix_a}")
-        output_lines.append("")
-
-        # Channel B
-        period_b = (regs.get("R3", 0) << 8) | regs.get("R2", 0)
-        freq_b = period_to_frequency(period_b)
-        vol_b = regs.get("R11", 0) & 0x0F
-        tone_b = "Tone" if not (r7 & 0x02) else ""
-        noise_b = "Noise" if not (r7 & 0x10) else ""
-        mix_b = "+".join(filter(None, [tone_b, noise_b])) or "NONE"
-
-        output_lines.append(f"Channel B: {freq_b:6.1f} Hz (period={period_b})")
-        output_lines.append(f"  Volume: {vol_b:2d}/15")
-        output_lines.append(f"  Mix: {mix_b}")
-        output_lines.append("")
-
-        # Channel C
-        period_c = (regs.get("R5", 0) << 8) | regs.get("R4", 0)
-        freq_c = period_to_frequency(period_c)
-        vol_c = regs.get("R12", 0) & 0x0F
-        tone_c = "Tone" if not (r7 & 0x04) else ""
-        noise_c = "Noise" if not (r7 & 0x20) else ""
-        mix_c = "+".join(filter(None, [tone_c, noise_c])) or "NONE"
-
-        output_lines.append(f"Channel C: {freq_c:6.1f} Hz (period={period_c})")
-        output_lines.append(f"  Volume: {vol_c:2d}/15")
-        output_lines.append(f"  Mix: {mix_c}")
-        output_lines.append("")
-
-        # Noise
-        noise_period = regs.get("R6", 0)
-        if noise_period > 0:
-            noise_freq = period_to_frequency(noise_period)
-            output_lines.append(f"Noise: {noise_freq:6.1f} Hz (period={noise_period})")
-        else:
-            output_lines.append("Noise: OFF")
-        output_lines.append("")
+        Every change to the PSG state reaches the display through
+        _update_register_display or _schedule_register_display, which both
+        call this, so the audio thread never reads the Qt-side model.
+        """
+        if self.audio_stream is not None:
+            self.audio_stream.set_registers(regs)
+
+    def _channel(self, idx: int) -> PSGChannel:
+        """Return channel A/B/C (index 0-2) of the current PSG state."""
+        state = self.current_state
+        return (state.channel_a, state.channel_b, state.channel_c)[idx]
+
+    @Slot(int, float)
+    def _on_channel_frequency(self, idx: int, frequency: float) -> None:
+        """Channel frequency control changed."""
+        self._channel(idx).frequency = frequency
+        self._schedule_register_display()
+
+    @Slot(int, int)
+    def _on_channel_volume(self, idx: int, volume: int) -> None:
+        """Channel volume fader changed."""
+        self._channel(idx).volume = volume
+        self._schedule_register_display()
+
+    @Slot(int, bool)
+    def _on_channel_tone(self, idx: int, enabled: bool) -> None:
+        """Channel tone enable toggled."""
+        self._channel(idx).tone_enabled = enabled
+        self._schedule_register_display()
+
+    @Slot(int, bool)
+    def _on_channel_noise(self, idx: int, enabled: bool) -> None:
+        """Channel noise enable toggled."""
+        self._channel(idx).noise_enabled = enabled
+        self._schedule_register_display()
+
+    def _schedule_register_display(self) -> None:
+        """Refresh the register display on the next debounce tick.
+
+        Audio is updated right away; only the labels wait for the tick.
+        """
+        self._publish_registers(self.current_state.to_register_array())
+        if not self._display_timer.isActive():
+            self._display_timer.start()
+
+    @Slot(int)
+    def _on_tab_changed(self, index: int) -> None:
+        """Bring the register displays up to date when the JAM tab is shown."""
+        if index == JAM_TAB_INDEX:
+            self._update_register_display()
 
-        # Mixer decode (R7 in binary for clarity)
-        output_lines.append(f"Mixer R7: {r7:08b}b")
-        output_lines.append("")
+    @Slot()
+    def _update_register_display(self) -> None:
+        """Update the register value display with current PSG state.
 
-        # Envelope (placeholder for future implementation)
-        # env_period = (regs.get('R14', 0) << 8) | regs.get('R13', 0)
-        # env_shape = regs.get('R15', 0)
-        output_lines.append("Envelope: Not implemented")
+        Audio always gets the new registers. The labels are only rebuilt
+        while the JAM tab is showing; _on_tab_changed catches them up later.
+        """
+        regs_array = self.current_state.to_register_array()
+        self._publish_registers(regs_array)
+        if self.tabs.currentIndex() != JAM_TAB_INDEX:
+            return
+        # Plain ints indexed by register number
+        regs = tuple(regs_array.tolist())
+        if regs == self._displayed_registers:
+            return  # Display already shows these values
+        self._displayed_registers = regs
+
+        # LEFT: Input (raw register values) - shows every register, so it
+        # differs whenever the register tuple does
+        self.register_input_display.setText(
+            _REGISTER_INPUT_FORMAT.format(*_register_hex(regs_array.tobytes()))
+        )
 
-        self.register_output_display.setText("\n".join(output_lines))
+        # RIGHT: Output (decoded values) - unchanged by e.g. envelope registers,
+        # so skip the relayout when the decoded text is the same
+        output_text = _decode_registers(regs)
+        if output_text != self._displayed_output:
+            self._displayed_output = output_text
+            self.register_output_display.setText(output_text)
 
+    @Slot()
     def _on_play_audio(self) -> None:
         """Start real-time audio playback with automatic backend fallback."""
         if not self.audio_available:
             self._warn_audio_missing()
             return
 
-        # Try current backend
-        if self.audio_stream and self.audio_stream.start():
+        previous = self.audio_backend
+        if self._start_audio():
             self.btn_play.setEnabled(False)
             self.btn_stop.setEnabled(True)
-            self.statusBar().showMessage(f"Playing with {self.audio_backend}…", 3000)
+            if previous not in (None, self.audio_backend):
+                self.jam_status_label.setText(f"Audio: {self.audio_backend} (fallback)")
+                self.jam_status_label.setStyleSheet("color: orange;")
+                self.statusBar().showMessage(f"Playing with {self.audio_backend} (fallback)…", 3000)
+            else:
+                self.jam_status_label.setText(f"Audio: {self.audio_backend}")
+                self.statusBar().showMessage(f"Playing with {self.audio_backend}…", 3000)
             return
 
-        # Current backend failed - try fallback to pygame
-        if self.audio_backend == "sounddevice" and PYGAME_AVAILABLE:
-            logger.warning("sounddevice failed to start, falling back to pygame")
+        # All backends failed
+        self._warn_playback_failed()
+
+    def _start_audio(self) -> bool:
+        """Start playback, creating or falling back to a backend as needed.
+
+        The current backend is tried first. If there is none yet, or it
+        fails to start, the backends after it in _AUDIO_BACKENDS are
+        imported and tried in order.
+
+        Returns:
+            True if a backend is now playing
+        """
+        if self.audio_stream is not None and self.audio_stream.start():
+            return True
+
+        names = [name for name, *_ in _AUDIO_BACKENDS]
+        first = names.index(self.audio_backend) + 1 if self.audio_backend else 0
+        for name, module, cls, flag in _AUDIO_BACKENDS[first:]:
+            if name not in self._audio_candidates:
+                continue
+            if self.audio_backend is not None:
+                logger.warning(f"{self.audio_backend} failed to start, falling back to {name}")
             try:
-                self.audio_stream = PygamePSGPlayer(self.current_state)
-                self.audio_backend = "pygame"
-                if self.audio_stream.start():
-                    self.btn_play.setEnabled(False)
-                    self.btn_stop.setEnabled(True)
-                    self.jam_status_label.setText(f"Audio: {self.audio_backend} (fallback)")
-                    self.jam_status_label.setStyleSheet("color: orange;")
-                    self.statusBar().showMessage(
-                        f"Playing with {self.audio_backend} (fallback)…", 3000
-                    )
-                    return
+                player_cls = _load_audio_backend(module, cls, flag)
+                if player_cls is None:
+                    continue
+                self.audio_stream = player_cls(self.current_state, latency_ms=self.audio_latency_ms)
+                self.audio_backend = name
+                logger.info(f"Audio initialized with {name}")
             except Exception as e:
-                logger.error(f"pygame fallback failed: {e}")
-
-        # All backends failed
-        QMessageBox.warning(
-            self,
-            "Playback Failed",
-            f"Failed to start audio with {self.audio_backend}.\n\n"
-            "Check console for errors. Audio may not be available in this environment.",
-        )
+                logger.error(f"{name} audio failed: {e}")
+                continue
+            if self.audio_stream.start():
+                return True
+        return False
 
+    @Slot()
     def _on_stop_audio(self) -> None:
         """Stop audio playback."""
         if self.audio_stream:
@@ -1191,6 +1441,15 @@ class MainWindow(QMainWindow):
             self.btn_stop.setEnabled(False)
             self.statusBar().showMessage("Playback stopped", 2000)
 
+    def _warn_playback_failed(self) -> None:
+        """Show warning popup when no audio backend could start."""
+        QMessageBox.warning(
+            self,
+            "Playback Failed",
+            f"Failed to start audio with {self.audio_backend or 'any backend'}.\n\n"
+            "Check console for errors. Audio may not be available in this environment.",
+        )
+
     def _warn_audio_missing(self) -> None:
         """Show warning popup when audio is unavailable."""
         QMessageBox.warning(
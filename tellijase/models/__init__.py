@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+from .frame_track import FRAME_FIELDS, TIMELINE_FRAMES, FrameTrack
 from .psg_channel import PSGChannel
 from .psg_state import PSGState
 
 __all__ = [
+    "FRAME_FIELDS",
+    "FrameTrack",
     "PSGChannel",
     "PSGState",
+    "TIMELINE_FRAMES",
 ]
@@ -0,0 +1,216 @@
+"""FrameTrack model - frame events for one FRAME-mode timeline track."""
+
+from __future__ import annotations
+
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Frames shown per timeline track (30 seconds at 60 FPS)
+TIMELINE_FRAMES = 1800
+
+# Frame data fields, in the order FrameTrack.fields() and records() return
+# them. They double as the dict keys of frame data and PSGChannel attributes.
+FRAME_FIELDS = ("frequency", "volume", "tone_enabled", "noise_enabled")
+
+# Largest volume FrameTrack stores; project files may hold any int, so larger
+# values are clamped rather than overflowing the volume array
+_VOLUME_MAX = int(np.iinfo(np.int16).max)
+
+# Bits of FrameTrack.flags
+_PRESENT = 0x01
+_TONE = 0x02
+_TONE_SET = 0x04
+_NOISE = 0x08
+_NOISE_SET = 0x10
+
+
+class FrameTrack:
+    """Per-frame event data for one track, stored as parallel arrays.
+
+    Each frame holds the same fields as a frame editor dict - frequency,
+    volume, tone_enabled, noise_enabled - any of which may be unset (None).
+    Frames are indexed directly, so lookups, playback and saving avoid
+    per-frame dicts; the arrays grow if an event lies past the end.
+    """
+
+    def __init__(self, num_frames: int = TIMELINE_FRAMES):
+        """Create an empty track.
+
+        Args:
+            num_frames: Initial number of frames
+        """
+        self.frequency = np.full(num_frames, np.nan)  # NaN = unset
+        self.volume = np.full(num_frames, -1, dtype=np.int16)  # -1 = unset
+        self.flags = np.zeros(num_frames, dtype=np.uint8)
+
+    def __len__(self) -> int:
+        """Number of frames holding data."""
+        return int(np.count_nonzero(self.flags & _PRESENT))
+
+    def __contains__(self, frame: int) -> bool:
+        return 0 <= frame < self.flags.size and bool(self.flags[frame] & _PRESENT)
+
+    def get(self, frame: int) -> Optional[dict]:
+        """Return a frame's data as a frame editor dict.
+
+        Args:
+            frame: Frame number
+
+        Returns:
+            Dict with frequency, volume, tone_enabled and noise_enabled
+            (None where unset), or None if the frame is empty
+        """
+        fields = self.fields(frame)
+        return None if fields is None else dict(zip(FRAME_FIELDS, fields))
+
+    def fields(self, frame: int) -> Optional[Tuple]:
+        """Return a frame's data as a tuple, without building a dict.
+
+        Args:
+            frame: Frame number
+
+        Returns:
+            (frequency, volume, tone_enabled, noise_enabled) as in FRAME_FIELDS,
+            None where unset, or None if the frame is empty
+        """
+        if frame not in self:
+            return None
+        flags = int(self.flags[frame])
+        frequency = float(self.frequency[frame])
+        volume = int(self.volume[frame])
+        return (
+            None if np.isnan(frequency) else frequency,
+            None if volume < 0 else volume,
+            bool(flags & _TONE) if flags & _TONE_SET else None,
+            bool(flags & _NOISE) if flags & _NOISE_SET else None,
+        )
+
+    def set(self, frame: int, data: dict) -> None:
+        """Store frame editor data at ``frame``.
+
+        Args:
+            frame: Frame number (>= 0)
+            data: Dict with any of frequency, volume, tone_enabled, noise_enabled
+        """
+        if frame >= self.flags.size:
+            self._grow(frame + 1)
+        frequency = data.get("frequency")
+        volume = data.get("volume")
+        self.frequency[frame] = np.nan if frequency is None else frequency
+        self.volume[frame] = -1 if volume is None else min(volume, _VOLUME_MAX)
+        self.flags[frame] = (
+            _PRESENT
+            | _flag_bits(data.get("tone_enabled"), _TONE, _TONE_SET)
+            | _flag_bits(data.get("noise_enabled"), _NOISE, _NOISE_SET)
+        )
+
+    def set_many(
+        self,
+        frames: Sequence[int],
+        frequency: Sequence[Optional[float]],
+        volume: Sequence[Optional[int]],
+        tone_enabled: Sequence[Optional[bool]],
+        noise_enabled: Sequence[Optional[bool]],
+    ) -> None:
+        """Store many frames at once - the bulk form of set().
+
+        Each field is written to its array in one assignment. If a frame
+        appears more than once, the last entry wins.
+
+        Args:
+            frames: Frame numbers (>= 0)
+            frequency: Frequency per frame, None where unset
+            volume: Volume per frame, None where unset
+            tone_enabled: Tone enable per frame, None where unset
+            noise_enabled: Noise enable per frame, None where unset
+        """
+        index = np.asarray(frames, dtype=np.intp)
+        if not index.size:
+            return
+        last = int(index.max())
+        if last >= self.flags.size:
+            self._grow(last + 1)
+        # float() of None is NaN, the unset marker
+        self.frequency[index] = np.array(frequency, dtype=np.float64)
+        self.volume[index] = [-1 if v is None else min(v, _VOLUME_MAX) for v in volume]
+        self.flags[index] = [
+            _PRESENT | _flag_bits(tone, _TONE, _TONE_SET) | _flag_bits(noise, _NOISE, _NOISE_SET)
+            for tone, noise in zip(tone_enabled, noise_enabled)
+        ]
+
+    def remove(self, frame: int) -> None:
+        """Empty ``frame`` (no-op if it holds no data)."""
+        if frame in self:
+            self.frequency[frame] = np.nan
+            self.volume[frame] = -1
+            self.flags[frame] = 0
+
+    def clear(self) -> None:
+        """Empty every frame."""
+        self.frequency.fill(np.nan)
+        self.volume.fill(-1)
+        self.flags.fill(0)
+
+    def frames(self) -> np.ndarray:
+        """Frame numbers holding data, in ascending order."""
+        return np.flatnonzero(self.flags & _PRESENT)
+
+    def items(self) -> Iterator[Tuple[int, dict]]:
+        """Iterate (frame, data) pairs in frame order."""
+        for frame, *fields in self.records():
+            yield frame, dict(zip(FRAME_FIELDS, fields))
+
+    def records(
+        self,
+    ) -> Iterator[Tuple[int, Optional[float], Optional[int], Optional[bool], Optional[bool]]]:
+        """Iterate frames as plain tuples, in frame order.
+
+        Fields are decoded for all frames at once with array operations,
+        so no per-frame dict is built.
+
+        Returns:
+            Iterator of (frame, frequency, volume, tone_enabled, noise_enabled),
+            with None for unset fields
+        """
+        frames = self.frames()
+        frequency = self.frequency[frames]
+        volume = self.volume[frames]
+        flags = self.flags[frames]
+        return zip(
+            frames.tolist(),
+            _optional(frequency, np.isnan(frequency)),
+            _optional(volume, volume < 0),
+            _optional((flags & _TONE) != 0, (flags & _TONE_SET) == 0),
+            _optional((flags & _NOISE) != 0, (flags & _NOISE_SET) == 0),
+        )
+
+    def last_frame(self) -> int:
+        """Highest frame holding data, or -1 if the track is empty."""
+        frames = self.frames()
+        return int(frames[-1]) if frames.size else -1
+
+    def _grow(self, min_frames: int) -> None:
+        """Extend the arrays to hold at least ``min_frames`` frames."""
+        size = max(min_frames, 2 * self.flags.size)
+        extra = size - self.flags.size
+        self.frequency = np.concatenate([self.frequency, np.full(extra, np.nan)])
+        self.volume = np.concatenate([self.volume, np.full(extra, -1, dtype=np.int16)])
+        self.flags = np.concatenate([self.flags, np.zeros(extra, dtype=np.uint8)])
+
+
+def _optional(values: np.ndarray, unset: np.ndarray) -> List:
+    """Convert values to Python scalars, with None where ``unset`` is True."""
+    out = values.astype(object)
+    out[unset] = None
+    return out.tolist()
+
+
+def _flag_bits(value: Optional[bool], bit: int, set_bit: int) -> int:
+    """Encode an optional bool as a value bit plus an is-set bit."""
+    if value is None:
+        return 0
+    return set_bit | (bit if value else 0)
+
+
+__all__ = ["FRAME_FIELDS", "FrameTrack", "TIMELINE_FRAMES"]
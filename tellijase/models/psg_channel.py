@@ -35,7 +35,7 @@ class PSGChannel:
         Returns:
             Dict with register names (R0, R1, R8, etc.) and values
         """
-        period = frequency_to_period(self.frequency)
+        period = self.period
 
         # Register offsets based on channel
         # Channel A: R0/R1 (period), R10 (volume)
@@ -48,17 +48,25 @@ class PSGChannel:
         coarse_reg = f"R{period_reg_base + 1}"
         vol_reg = f"R{volume_reg}"
 
-        # Volume byte: bits 0-3 = volume, bit 4 = envelope mode
-        volume_byte = self.volume & 0x0F
-        if self.envelope_mode:
-            volume_byte |= 0x10  # Set M bit
-
         return {
             fine_reg: period & 0xFF,
             coarse_reg: (period >> 8) & 0x0F,
-            vol_reg: volume_byte,
+            vol_reg: self.volume_byte,
         }
 
+    @property
+    def period(self) -> int:
+        """12-bit tone period for the current frequency."""
+        return frequency_to_period(self.frequency)
+
+    @property
+    def volume_byte(self) -> int:
+        """Volume register value: bits 0-3 = volume, bit 4 = envelope mode."""
+        volume_byte = self.volume & 0x0F
+        if self.envelope_mode:
+            volume_byte |= 0x10  # Set M bit
+        return volume_byte
+
     @classmethod
     def from_registers(
         cls,
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field, fields, replace
 from typing import Dict
 
+import numpy as np
+
 from .psg_channel import PSGChannel
 
 
@@ -44,6 +46,26 @@ class PSGState:
         regs.update(self.channel_c.to_registers(2))
 
         # R7 mixer control (inverted logic: 0=enable, 1=disable)
+        regs["R7"] = self.mixer_byte()
+
+        # R6 noise period
+        regs["R6"] = self.noise_period & 0x1F
+
+        # R13/R14 envelope period (16-bit)
+        regs["R13"] = self.envelope_period & 0xFF
+        regs["R14"] = (self.envelope_period >> 8) & 0xFF
+
+        # R15 envelope shape
+        regs["R15"] = self.envelope_shape & 0x0F
+
+        return regs
+
+    def mixer_byte(self) -> int:
+        """Build the R7 mixer control byte.
+
+        Returns:
+            R7 value (inverted logic: 0=enable, 1=disable)
+        """
         # Bit 0: Channel A tone
         # Bit 1: Channel B tone
         # Bit 2: Channel C tone
@@ -66,19 +88,43 @@ class PSGState:
         if self.channel_c.noise_enabled:
             r7 &= ~0x20
 
-        regs["R7"] = r7
-
-        # R6 noise period
-        regs["R6"] = self.noise_period & 0x1F
+        return r7
 
-        # R13/R14 envelope period (16-bit)
-        regs["R13"] = self.envelope_period & 0xFF
-        regs["R14"] = (self.envelope_period >> 8) & 0xFF
+    def to_register_array(self) -> np.ndarray:
+        """Flatten to a uint8[16] register array for audio synthesis.
 
-        # R15 envelope shape
-        regs["R15"] = self.envelope_shape & 0x0F
+        Same values as to_registers(), indexed by register number, without
+        building a string-keyed dict (used on the audio hot path). The array
+        is a standalone copy, so audio threads can render from it instead
+        of taking a snapshot().
 
-        return regs
+        Returns:
+            uint8 array of R0-R15
+        """
+        period_a = self.channel_a.period
+        period_b = self.channel_b.period
+        period_c = self.channel_c.period
+        return np.array(
+            [
+                period_a & 0xFF,
+                (period_a >> 8) & 0x0F,
+                period_b & 0xFF,
+                (period_b >> 8) & 0x0F,
+                period_c & 0xFF,
+                (period_c >> 8) & 0x0F,
+                self.noise_period & 0x1F,
+                self.mixer_byte(),
+                0,
+                0,
+                self.channel_a.volume_byte,
+                self.channel_b.volume_byte,
+                self.channel_c.volume_byte,
+                self.envelope_period & 0xFF,
+                (self.envelope_period >> 8) & 0xFF,
+                self.envelope_shape & 0x0F,
+            ],
+            dtype=np.uint8,
+        )
 
     def snapshot(self) -> PSGState:
         """Create thread-safe immutable copy for audio thread.
@@ -93,6 +139,19 @@ class PSGState:
             channel_c=replace(self.channel_c),
         )
 
+    def reset(self) -> None:
+        """Restore every parameter to its default, in place.
+
+        Unlike assigning a fresh PSGState(), this keeps the state and its
+        channel objects, so references held elsewhere stay valid.
+        """
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, PSGChannel):
+                vars(value).update(vars(PSGChannel()))
+            else:
+                setattr(self, f.name, f.default)
+
     @classmethod
     def from_registers(cls, registers: Dict[str, int]) -> PSGState:
         """Deserialize from register dict (for loading projects).
@@ -0,0 +1,56 @@
+"""Flat AY-3-8914 register file representation.
+
+The chip has exactly 16 eight-bit registers, so a full snapshot fits in a
+``uint8[16]`` array indexed by register number. This avoids building and
+hashing ``{"R0": ..., "R15": ...}`` dicts on audio hot paths.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Mapping
+
+import numpy as np
+
+NUM_REGISTERS = 16
+
+# Register indices into a register array
+R0, R1, R2, R3, R4, R5, R6, R7, R8, R9, R10, R11, R12, R13, R14, R15 = range(NUM_REGISTERS)
+
+
+def registers_to_array(registers: Mapping[str, int]) -> np.ndarray:
+    """Pack a register dict (keys 'R0'-'R15') into a uint8[16] array.
+
+    Missing registers are zero; values are truncated to 8 bits.
+    """
+    regs = np.zeros(NUM_REGISTERS, dtype=np.uint8)
+    for key, value in registers.items():
+        regs[int(key[1:])] = int(value) & 0xFF
+    return regs
+
+
+def array_to_registers(regs: np.ndarray) -> Dict[str, int]:
+    """Unpack a uint8[16] register array into a 'R0'-'R15' dict."""
+    return {f"R{idx}": int(value) for idx, value in enumerate(regs)}
+
+
+__all__ = [
+    "NUM_REGISTERS",
+    "R0",
+    "R1",
+    "R2",
+    "R3",
+    "R4",
+    "R5",
+    "R6",
+    "R7",
+    "R8",
+    "R9",
+    "R10",
+    "R11",
+    "R12",
+    "R13",
+    "R14",
+    "R15",
+    "registers_to_array",
+    "array_to_registers",
+]
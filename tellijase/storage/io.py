@@ -29,13 +29,23 @@ def load_project(path: PathLike) -> Project:
     project_path = Path(path)
     with project_path.open("r", encoding="utf-8") as handle:
         data = json.load(handle)
-    return Project.from_dict(data)
+    project = Project.from_dict(data)
+    project.mark_saved(project_path)
+    return project
 
 
 def save_project(project: Project, path: PathLike) -> Path:
+    """Write the project as JSON, skipping the write if nothing changed.
+
+    A project that has not been touch()ed since it was last loaded from or
+    saved to the same file is left as is on disk.
+    """
     project_path = ensure_extension(Path(path))
+    if not project.dirty and project.saved_path == project_path and project_path.exists():
+        return project_path
     project_path.parent.mkdir(parents=True, exist_ok=True)
     project.touch()
     with project_path.open("w", encoding="utf-8") as handle:
         json.dump(project.to_dict(), handle, indent=2)
+    project.mark_saved(project_path)
     return project_path
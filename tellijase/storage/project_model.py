@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 REGISTER_KEYS = [
@@ -29,7 +30,7 @@ CHANNEL_IDS = ("A", "B", "C", "N")
 
 
 def _now_str() -> str:
-    return datetime.utcnow().isoformat()
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
 
 
 def _parse_time(value: Optional[str]) -> str:
@@ -196,9 +197,18 @@ class Project:
     meta: Metadata = field(default_factory=Metadata)
     jam_sessions: List[JamSession] = field(default_factory=list)
     songs: List[Song] = field(default_factory=list)
+    # Unsaved-changes tracking (not serialized): set by touch(), cleared by
+    # save_project/load_project along with the file the project matches
+    dirty: bool = field(default=True, repr=False, compare=False)
+    saved_path: Optional[Path] = field(default=None, repr=False, compare=False)
 
     def touch(self) -> None:
         self.meta.modified = _now_str()
+        self.dirty = True
+
+    def mark_saved(self, path: Path) -> None:
+        self.dirty = False
+        self.saved_path = path
 
     def to_dict(self) -> Dict[str, Any]:
         return {
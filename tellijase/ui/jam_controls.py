@@ -306,13 +306,18 @@ class ChannelControl(QGroupBox):
         # Update frequency label
         self.freq_label.setText(f"Freq: {int(frequency)} Hz")
 
-    def emit_state(self) -> None:
-        """Force emission of current UI state (for initialization)."""
-        self.frequency_changed.emit(float(self.freq_slider.value()))
-        self.volume_changed.emit(self.vol_slider.value())
-        self.tone_enabled_changed.emit(self.tone_check.isChecked())
-        self.noise_enabled_changed.emit(self.noise_check.isChecked())
-        self.muted_changed.emit(self.mute_btn.isChecked())
+    def current_state(self) -> dict:
+        """Return current UI state as PSGChannel field values (for initialization).
+
+        Returns:
+            Dict with frequency, volume, tone_enabled and noise_enabled
+        """
+        return {
+            "frequency": float(self.freq_slider.value()),
+            "volume": self.vol_slider.value(),
+            "tone_enabled": self.tone_check.isChecked(),
+            "noise_enabled": self.noise_check.isChecked(),
+        }
 
 
 __all__ = ["ChannelControl"]
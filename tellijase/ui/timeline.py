@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, Signal, QRect
+from PySide6.QtCore import Qt, Signal, Slot, QRect
 from PySide6.QtGui import QPainter, QColor, QPen
 from PySide6.QtWidgets import (
     QWidget,
@@ -208,6 +208,11 @@ class TrackTimeline(QWidget):
         if 0 <= frame_number < len(self.cells):
             self.cells[frame_number].set_filled(filled)
 
+    def set_frame_highlighted(self, frame_number: int, highlighted: bool) -> None:
+        """Set the playback highlight of a specific frame (ignored if out of range)."""
+        if 0 <= frame_number < len(self.cells):
+            self.cells[frame_number].set_highlighted(highlighted)
+
     def set_frame_data(self, frame_number: int, data: dict | None) -> None:
         """Set frame data with visualization.
 
@@ -218,6 +223,12 @@ class TrackTimeline(QWidget):
         if 0 <= frame_number < len(self.cells):
             self.cells[frame_number].set_data(data)
 
+    def clear_frames(self) -> None:
+        """Empty every frame, repainting only cells that held data."""
+        for cell in self.cells:
+            if cell.is_filled:
+                cell.set_data(None)
+
 
 class FrameTimeline(QWidget):
     """Complete timeline view with all tracks."""
@@ -231,6 +242,7 @@ class FrameTimeline(QWidget):
         self.num_frames = 1800  # 30 seconds at 60 FPS
         self.tracks: list[TrackTimeline] = []
         self.clipboard = []  # Store copied frame data: [(track_idx, frame_num, data), ...]
+        self.playback_position = -1  # Highlighted frame, or -1 for none
         self.setFocusPolicy(Qt.StrongFocus)  # Allow keyboard events
 
         layout = QVBoxLayout(self)
@@ -290,15 +302,60 @@ class FrameTimeline(QWidget):
                 # Pass actual data for visualization
                 self.tracks[track_index].set_frame_data(frame_number, data)
 
+    def set_frames_data(self, entries: list) -> None:
+        """Set the data of many frames, on any tracks, with a single repaint.
+
+        Args:
+            entries: List of (track_index, frame_number, data) tuples, as
+                     emitted by frames_pasted
+        """
+        # Cells repaint once when updates are re-enabled, not once per frame
+        self.setUpdatesEnabled(False)
+        try:
+            for track_index, frame_number, data in entries:
+                self.set_frame_data(track_index, frame_number, data)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def set_track_data(self, track_index: int, frames) -> None:
+        """Set the data of many frames on one track with a single repaint.
+
+        Cells keep a data dict per frame for painting and copying, so the
+        frames are passed as dicts rather than FrameTrack.records() tuples.
+
+        Args:
+            track_index: Track index (0-4)
+            frames: Iterable of (frame_number, data) pairs, e.g. FrameTrack.items()
+        """
+        if not 0 <= track_index < len(self.tracks):
+            return
+        track = self.tracks[track_index]
+        # Cells repaint once when updates are re-enabled, not once per frame
+        self.setUpdatesEnabled(False)
+        try:
+            for frame_number, data in frames:
+                track.set_frame_data(frame_number, data)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def clear_all(self) -> None:
+        """Empty every frame on every track."""
+        for track in self.tracks:
+            track.clear_frames()
+
     def set_playback_position(self, frame_number: int) -> None:
         """Highlight a specific frame across all tracks for playback position.
 
         Args:
             frame_number: Frame number to highlight (0-127), or -1 to clear all
         """
+        # Only the previously and newly highlighted cells need repainting
+        if frame_number == self.playback_position:
+            return
         for track in self.tracks:
-            for idx, cell in enumerate(track.cells):
-                cell.set_highlighted(idx == frame_number)
+            track.set_frame_highlighted(self.playback_position, False)
+            track.set_frame_highlighted(frame_number, True)
+        self.playback_position = frame_number
 
     def keyPressEvent(self, event) -> None:
         """Handle keyboard shortcuts for copy/paste."""
@@ -421,6 +478,7 @@ class FrameEditor(QGroupBox):
         self.btn_apply.clicked.connect(self._on_apply_clicked)
         self.btn_clear.clicked.connect(self._on_clear_clicked)
 
+    @Slot()
     def _on_apply_clicked(self) -> None:
         """Apply button clicked - emit frame data."""
         if self.current_track < 0 or self.current_frame < 0:
@@ -440,6 +498,7 @@ class FrameEditor(QGroupBox):
 
         self.frame_applied.emit(self.current_track, self.current_frame, data)
 
+    @Slot()
     def _on_clear_clicked(self) -> None:
         """Clear button clicked - clear the frame."""
         if self.current_track < 0 or self.current_frame < 0:
@@ -478,14 +537,14 @@ class FrameEditor(QGroupBox):
             self.btn_noise_enable.setChecked(False)
         else:
             # Load data from frame
-            if data.get("frequency") is not None:
-                self.freq_spin.setValue(int(data["frequency"]))
-            if data.get("volume") is not None:
-                self.vol_spin.setValue(int(data["volume"]))
-            if data.get("tone_enabled") is not None:
-                self.btn_tone_enable.setChecked(bool(data["tone_enabled"]))
-            if data.get("noise_enabled") is not None:
-                self.btn_noise_enable.setChecked(bool(data["noise_enabled"]))
+            if (frequency := data.get("frequency")) is not None:
+                self.freq_spin.setValue(int(frequency))
+            if (volume := data.get("volume")) is not None:
+                self.vol_spin.setValue(int(volume))
+            if (tone_enabled := data.get("tone_enabled")) is not None:
+                self.btn_tone_enable.setChecked(bool(tone_enabled))
+            if (noise_enabled := data.get("noise_enabled")) is not None:
+                self.btn_noise_enable.setChecked(bool(noise_enabled))
 
 
 __all__ = ["FrameTimeline", "FrameEditor"]
@@ -1,6 +1,16 @@
 import numpy as np
 
+from tellijase.audio import _kernels
+from tellijase.audio._kernels import (
+    aligned_empty,
+    f32_to_i16,
+    lfsr_clocked_fill,
+    lfsr_fill,
+    lfsr_hold_fill,
+    square_mix,
+)
 from tellijase.audio.engine import AY38914Synth
+from tellijase.psg.registers import array_to_registers, registers_to_array
 from tellijase.psg.utils import frequency_to_period, period_to_frequency
 
 
@@ -18,3 +28,90 @@ def test_synth_generates_audio():
     assert buffer.ndim == 1
     assert len(buffer) == 800
     assert np.max(np.abs(buffer)) <= 1.0
+
+
+def test_square_mix_sums_fixed_point_channels():
+    out = np.empty(8, dtype=np.float32)
+    half_cycle = 1 << 29  # period of 8 samples
+    square_mix(out, np.array([half_cycle], dtype=np.int64), np.array([15], dtype=np.int64))
+    assert out.tolist() == [1.0, 1.0, 1.0, 1.0, -1.0, -1.0, -1.0, -1.0]
+
+
+def test_synth_reuses_cached_render():
+    synth = AY38914Synth(sample_rate=8000)
+    registers = {"R0": 0xFE, "R1": 0x00, "R8": 15}
+    first = synth.render(registers, duration=0.1)
+    assert synth.render(dict(registers), duration=0.1) is first
+    assert synth.render(registers, duration=0.2) is not first
+    assert not first.flags.writeable
+
+
+def test_f32_to_i16_clips_and_scales_in_place():
+    src = np.array([-2.0, -1.0, -0.5, 0.0, 0.5, 1.0, 3.0], dtype=np.float32)
+    dst = np.empty(len(src), dtype=np.int16)
+    out = f32_to_i16(src, dst)
+    assert out is dst
+    assert dst.tolist() == [-32767, -32767, -16383, 0, 16383, 32767, 32767]
+
+
+def test_noise_wave_is_cached_bipolar_lfsr():
+    noise = AY38914Synth._noise_wave(4, 1000, 8000)
+    assert noise.dtype == np.int8
+    assert len(noise) == 1000
+    assert set(np.unique(noise).tolist()) == {-1, 1}
+    assert AY38914Synth._noise_wave(4, 1000, 8000) is noise
+
+
+def test_synth_accepts_register_array():
+    registers = {"R0": 0xFE, "R1": 0x01, "R8": 12, "R6": 4}
+    regs = registers_to_array(registers)
+    assert regs.dtype == np.uint8 and regs.shape == (16,)
+    assert array_to_registers(regs)["R1"] == 0x01
+
+    synth = AY38914Synth(sample_rate=8000)
+    from_dict = synth.render(registers, duration=0.1)
+    assert synth.render(regs, duration=0.1) is from_dict
+
+
+def test_synth_uses_fixed_headroom():
+    synth = AY38914Synth(sample_rate=8000)
+    quiet = synth.render({"R0": 0xFE, "R8": 3}, duration=0.1)
+    loud = synth.render({"R0": 0xFE, "R8": 15}, duration=0.1)
+    assert np.max(np.abs(quiet)) < np.max(np.abs(loud)) <= 1.0
+
+
+def test_lfsr_hold_fill_repeats_each_step():
+    steps = np.empty(4, dtype=np.int8)
+    expected_state = lfsr_fill(steps, 1)
+    held = np.empty(10, dtype=np.float32)
+    assert lfsr_hold_fill(held, 1, 3) == expected_state
+    np.testing.assert_array_equal(held, np.repeat(steps, 3)[:10])
+
+
+def test_lfsr_clocked_fill_steps_on_clock_wraps():
+    steps = np.empty(5, dtype=np.int8)
+    expected_state = lfsr_fill(steps, 1)
+    out = np.empty(10, dtype=np.float32)
+    # Half a noise clock per sample: the LFSR steps on every second sample
+    state, phase = lfsr_clocked_fill(out, 1, 0, 1 << 31)
+    assert (state, phase) == (expected_state, 0)
+    np.testing.assert_array_equal(out, np.concatenate([[1], np.repeat(steps, 2)[:9]]))
+
+
+def test_lfsr_sequence_table_matches_stepping():
+    states, positions, outputs = _kernels._lfsr_sequence()
+    assert len(np.unique(states)) == _kernels.LFSR_PERIOD
+
+    stepped = np.empty(300, dtype=np.int8)
+    start = positions[int(states[1000])]
+    final = int(_kernels._lfsr_loop(stepped, int(states[start])))
+    assert final == states[start + 300]
+    np.testing.assert_array_equal(stepped, outputs[np.arange(start + 1, start + 301)])
+
+
+def test_aligned_empty_is_cache_line_aligned():
+    for shape, dtype in [(7, np.float32), ((3, 129), np.uint32), (33, np.int8)]:
+        buf = aligned_empty(shape, dtype)
+        assert buf.ctypes.data % _kernels.BUFFER_ALIGN == 0
+        assert buf.shape == np.empty(shape).shape and buf.dtype == dtype
+        assert buf.flags.c_contiguous and buf.flags.writeable
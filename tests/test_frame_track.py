@@ -0,0 +1,66 @@
+"""Tests for the FrameTrack timeline model."""
+
+from tellijase.models import FrameTrack
+
+
+def test_frame_track_round_trips_frame_data():
+    track = FrameTrack(num_frames=16)
+    full = {"frequency": 440.0, "volume": 9, "tone_enabled": True, "noise_enabled": False}
+    partial = {"frequency": None, "volume": 7, "tone_enabled": None, "noise_enabled": None}
+    track.set(3, full)
+    track.set(1, partial)
+
+    assert track.get(3) == full
+    assert track.get(1) == partial
+    assert track.get(2) is None
+    assert track.fields(3) == (440.0, 9, True, False)
+    assert track.fields(2) is None
+    assert len(track) == 2 and 3 in track and 2 not in track
+    assert [frame for frame, _ in track.items()] == [1, 3]
+    assert track.last_frame() == 3
+
+    track.remove(3)
+    assert 3 not in track and track.last_frame() == 1
+    track.clear()
+    assert len(track) == 0 and track.last_frame() == -1
+
+
+def test_frame_track_grows_for_late_frames():
+    track = FrameTrack(num_frames=4)
+    track.set(10, {"volume": 5})
+    assert track.get(10) == {
+        "frequency": None,
+        "volume": 5,
+        "tone_enabled": None,
+        "noise_enabled": None,
+    }
+    assert track.last_frame() == 10
+
+
+def test_frame_track_records_match_items():
+    track = FrameTrack(num_frames=8)
+    track.set(5, {"frequency": 220.0, "volume": 3, "tone_enabled": False, "noise_enabled": True})
+    track.set(2, {"volume": 0})
+    assert list(track.records()) == [
+        (2, None, 0, None, None),
+        (5, 220.0, 3, False, True),
+    ]
+    assert [data for _, data in track.items()] == [track.get(2), track.get(5)]
+
+
+def test_frame_track_set_many_matches_set():
+    bulk = FrameTrack(num_frames=4)
+    bulk.set_many([1, 6], [440.0, None], [9, None], [True, None], [None, False])
+    single = FrameTrack(num_frames=4)
+    single.set(1, {"frequency": 440.0, "volume": 9, "tone_enabled": True})
+    single.set(6, {"noise_enabled": False})
+    assert list(bulk.items()) == list(single.items())
+
+
+def test_frame_track_keeps_out_of_range_volumes():
+    track = FrameTrack(num_frames=8)
+    track.set_many([1, 2], [None, None], [200, 10**6], [False, False], [None, None])
+    track.set(3, {"volume": 300})
+    assert track.fields(1)[1] == 200
+    assert track.fields(2)[1] == 32767  # Clamped to the storage range
+    assert track.get(3)["volume"] == 300
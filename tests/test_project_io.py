@@ -259,3 +259,18 @@ def test_track_event_all_fields(tmp_path):
     assert evt.envelope_id == "env-1"
     assert evt.instrument_id == "inst-1"
     assert evt.noise is True
+
+
+def test_save_skips_unchanged_project(tmp_path):
+    project = new_project("Clean")
+    path = save_project(project, tmp_path / "clean")
+    assert not project.dirty
+
+    # An unchanged project is not rewritten, a touched one is
+    path.write_text("sentinel", encoding="utf-8")
+    save_project(project, path)
+    assert path.read_text(encoding="utf-8") == "sentinel"
+
+    project.touch()
+    save_project(project, path)
+    assert load_project(path).meta.name == "Clean"
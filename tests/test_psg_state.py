@@ -1,6 +1,7 @@
 """Tests for PSGState model with correct R7 mixer logic."""
 
 from tellijase.models import PSGChannel, PSGState
+from tellijase.psg.registers import registers_to_array
 
 
 def test_psg_state_default():
@@ -121,3 +122,26 @@ def test_psg_channel_to_registers():
     # Check period is non-zero
     period = (regs["R1"] << 8) | regs["R0"]
     assert period > 0
+
+
+def test_psg_state_register_array_matches_dict():
+    """Test to_register_array() agrees with to_registers()."""
+    state = PSGState(noise_period=17, envelope_period=0x1234, envelope_shape=9)
+    state.channel_a.frequency = 1000.0
+    state.channel_b.noise_enabled = True
+    state.channel_c.envelope_mode = True
+
+    assert state.to_register_array().tolist() == registers_to_array(state.to_registers()).tolist()
+
+
+def test_psg_state_reset_in_place():
+    """Test reset() restores defaults without replacing the channel objects."""
+    state = PSGState(noise_period=20, envelope_shape=3)
+    channel_a = state.channel_a
+    channel_a.frequency = 1000.0
+    channel_a.noise_enabled = True
+
+    state.reset()
+
+    assert state.channel_a is channel_a
+    assert state == PSGState()
@@ -0,0 +1,29 @@
+"""Tests for the PCM ring buffer used by the audio stream."""
+
+import threading
+
+import numpy as np
+
+from tellijase.audio.ring import PCMRingBuffer
+
+
+def test_ring_buffer_wraps_and_pads_underrun():
+    ring = PCMRingBuffer(8)
+    assert ring.write(np.arange(6, dtype=np.float32)) == 6
+    out = np.empty(4, dtype=np.float32)
+    assert ring.read_into(out) == 4
+    # write wraps around the end of the ring and stops when full
+    assert ring.write(np.arange(6, 12, dtype=np.float32)) == 6
+    assert ring.space == 0
+    out = np.empty(10, dtype=np.float32)
+    assert ring.read_into(out) == 8
+    np.testing.assert_array_equal(out, [4, 5, 6, 7, 8, 9, 10, 11, 0, 0])
+
+
+def test_ring_buffer_wait_for_data_wakes_on_write():
+    ring = PCMRingBuffer(8)
+    assert not ring.wait_for_data(4, timeout=0.01)
+    writer = threading.Timer(0.05, ring.write, args=(np.ones(4, dtype=np.float32),))
+    writer.start()
+    assert ring.wait_for_data(4, timeout=2.0)
+    writer.join()
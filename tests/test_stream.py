@@ -0,0 +1,32 @@
+"""Tests for the sounddevice-backed LivePSGStream."""
+
+from tellijase.audio.stream import LivePSGStream
+from tellijase.models import PSGState
+
+
+class _FakeOutputStream:
+    """Stand-in for sd.OutputStream that never runs the callback."""
+
+    active = False
+
+    def start(self):
+        self.active = True
+
+    def abort(self):
+        self.active = False
+
+
+def test_stream_clock_restarts_after_stop():
+    stream = LivePSGStream(PSGState(), sample_rate=8000, block_size=256)
+    stream.stream = _FakeOutputStream()
+    stream.stream.start()
+    stream._clock = (8000, 0)  # As left by a callback long ago
+    assert stream.playback_time_ns() is not None
+
+    stream.stop()
+    assert stream._resume()
+    try:
+        # No callback has run since the restart, so there is no clock yet
+        assert stream.playback_time_ns() is None
+    finally:
+        stream.stop()
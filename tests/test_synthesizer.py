@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from tellijase.audio import synthesizer
+from tellijase.audio._kernels import NUMBA_AVAILABLE
+from tellijase.audio.synthesizer import PSGSynthesizer
+from tellijase.models import PSGState
+
+
+def _tone_state() -> PSGState:
+    state = PSGState()
+    state.channel_a.frequency = 440.0
+    state.channel_b.frequency = 660.0
+    state.channel_c.volume = 0
+    return state
+
+
+def test_render_buffer_is_phase_continuous():
+    state = _tone_state()
+    whole = PSGSynthesizer(sample_rate=8000).render_buffer(2048, state).copy()
+
+    synth = PSGSynthesizer(sample_rate=8000)
+    first = synth.render_buffer(1000, state).copy()
+    second = synth.render_buffer(1048, state).copy()
+    np.testing.assert_array_equal(np.concatenate([first, second]), whole)
+
+
+def test_tone_and_noise_are_and_gated():
+    state = PSGState(noise_period=4)
+    state.channel_a.noise_enabled = True
+    state.channel_a.volume = 15
+    state.channel_b.volume = 0
+    state.channel_c.volume = 0
+
+    samples = PSGSynthesizer(sample_rate=8000).render_buffer(4000, state)
+    tone_only = state.snapshot()
+    tone_only.channel_a.noise_enabled = False
+    tone = PSGSynthesizer(sample_rate=8000).render_buffer(4000, tone_only)
+
+    # The gated channel is only ever high where the tone alone is high
+    assert set(np.unique(np.sign(samples))) == {-1.0, 1.0}
+    assert np.all(tone[samples > 0] > 0)
+    assert (samples > 0).sum() < (tone > 0).sum()
+
+
+def test_render_buffer_reuses_preallocated_output():
+    synth = PSGSynthesizer(sample_rate=8000, block_size=256)
+    first = synth.render_buffer(256, _tone_state())
+    assert np.shares_memory(first, synth.render_buffer(128, _tone_state()))
+
+    # Larger requests grow the scratch buffers instead of failing
+    assert synth.render_buffer(1000, _tone_state()).shape == (1000,)
+    assert synth.block_size == 1000
+
+
+def test_render_buffer_uses_fixed_gain():
+    loud = PSGState(noise_period=0)
+    for channel in (loud.channel_a, loud.channel_b, loud.channel_c):
+        channel.frequency = 440.0
+        channel.volume = 15
+    samples = PSGSynthesizer(sample_rate=8000).render_buffer(2048, loud)
+    assert np.abs(samples).max() == pytest.approx(1.0)
+
+    # A single channel keeps its share of full scale instead of being normalized up
+    loud.channel_b.volume = loud.channel_c.volume = 0
+    samples = PSGSynthesizer(sample_rate=8000).render_buffer(2048, loud)
+    assert np.abs(samples).max() == pytest.approx(1.0 / 3)
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="needs Numba")
+def test_compiled_mix_matches_numpy_path(monkeypatch):
+    state = _tone_state()
+    state.noise_period = 5
+    state.channel_b.noise_enabled = True
+    state.channel_c.volume = 9
+    state.channel_c.tone_enabled = False
+    state.channel_c.noise_enabled = True
+
+    compiled = PSGSynthesizer(sample_rate=8000)
+    expected = [compiled.render_buffer(1500, state).copy() for _ in range(2)]
+
+    monkeypatch.setattr(synthesizer, "NUMBA_AVAILABLE", False)
+    fallback = PSGSynthesizer(sample_rate=8000)
+    for block in expected:
+        np.testing.assert_array_equal(fallback.render_buffer(1500, state), block)
+
+
+def test_render_buffer_accepts_register_array():
+    state = _tone_state()
+    expected = PSGSynthesizer(sample_rate=8000).render_buffer(512, state).copy()
+    samples = PSGSynthesizer(sample_rate=8000).render_buffer(512, state.to_register_array())
+    np.testing.assert_array_equal(samples, expected)